@@ -17,6 +17,9 @@ setup(
     install_requires=[
         "packaging>=20.0"
     ],
+    extras_require={
+        "fast": ["orjson>=3.0"],
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -5,6 +5,8 @@ Test script for the metadata-py CLI tool.
 This script tests the main functionality of the metadata management tool.
 """
 
+import io
+import json
 import os
 import sys
 import shutil
@@ -16,7 +18,7 @@ from unittest.mock import patch
 # Add the package directory to the path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from update_metadata.cli import main as cli_main
+from update_metadata.cli import confirm, main as cli_main
 
 
 class TestMetadataCLI(unittest.TestCase):
@@ -97,6 +99,193 @@ class TestMetadataCLI(unittest.TestCase):
             content = f.read()
             self.assertNotIn('"author": "Test User"', content)
     
+    def test_update_many_files(self):
+        """Test updating enough files to use the worker pool."""
+        files = []
+        for i in range(6):
+            filepath = os.path.join(self.test_dir, f'doc{i}.md')
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(f"# Document {i}\n\nContent {i}.")
+            files.append(filepath)
+
+        result = self._run_cli(['update', '--set', 'author=Test User', '--jobs', '2', '--yes'] + files)
+        self.assertEqual(result, 0)
+
+        timestamps = set()
+        for filepath in files:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                content = f.read()
+                self.assertIn('"author": "Test User"', content)
+                timestamps.update(line for line in content.splitlines() if '"updated_at"' in line)
+        # The whole run shares one timestamp
+        self.assertEqual(len(timestamps), 1)
+
+    def test_update_many_files_output(self):
+        """Test that worker processes' output is printed whole lines, in file order."""
+        files = []
+        for i in range(6):
+            filepath = os.path.join(self.test_dir, f'doc{i}.md')
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(f"# Document {i}\n")
+            files.append(filepath)
+
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self._run_cli(['update', '--set', 'author=Test User', '--jobs', '3', '--yes'] + files)
+
+        lines = [line for line in stdout.getvalue().splitlines() if line.startswith('Updated')]
+        self.assertEqual(lines, [f"Updated metadata in {filepath}" for filepath in files])
+
+    def test_update_output_per_file(self):
+        """Test that a terminal sees each file's output once the file is done."""
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding='utf-8', line_buffering=True)
+        written_before = []
+
+        def process(filepath, **kwargs):
+            written_before.append(raw.getvalue())
+            print(f"Updated metadata in {filepath}")
+            print("details")
+            return True
+
+        second_file = os.path.join(self.test_dir, 'second.md')
+        with open(second_file, 'w', encoding='utf-8') as f:
+            f.write("# Second\n")
+        with patch('sys.stdout', stream), \
+                patch('update_metadata.core.process_file', side_effect=process):
+            self._run_cli(['update', '--no-auto-author', '--jobs', '1', '--yes', self.sample_file, second_file])
+
+        self.assertEqual(written_before[0], b'')
+        self.assertEqual(
+            written_before[1].decode('utf-8'), f"Updated metadata in {self.sample_file}\ndetails\n"
+        )
+
+    def test_report_output(self):
+        """Test writing the project report to a file."""
+        original_dir = os.getcwd()
+        os.chdir(self.test_dir)
+
+        try:
+            self.test_update_metadata()
+            report_path = os.path.join(self.test_dir, 'report.txt')
+
+            result = self._run_cli(['report', '--output', report_path])
+            self.assertEqual(result, 0)
+
+            with open(report_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+                self.assertIn('# Markdown Files Metadata Report', content)
+                self.assertIn('- Files with metadata: 1', content)
+                self.assertIn('- Test User: 1 files', content)
+        finally:
+            os.chdir(original_dir)
+
+    def test_report_parallel(self):
+        """Test that reading files on several threads gives the same totals."""
+        original_dir = os.getcwd()
+        os.chdir(self.test_dir)
+
+        try:
+            for i in range(4):
+                with open(f'doc{i}.md', 'w', encoding='utf-8') as f:
+                    f.write(f"# Document {i}\n")
+            self._run_cli(['update', '--set', 'author=Test User', '--yes'])
+            report_path = os.path.join(self.test_dir, 'report.txt')
+
+            result = self._run_cli(['report', '--jobs', '3', '--output', report_path])
+            self.assertEqual(result, 0)
+
+            with open(report_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+                self.assertIn('- Total markdown files: 5', content)
+                self.assertIn('- Test User: 5 files', content)
+        finally:
+            os.chdir(original_dir)
+
+    def test_bulk_cache(self):
+        """Test that --cache skips files unchanged since the last run."""
+        original_dir = os.getcwd()
+        os.chdir(self.test_dir)
+
+        try:
+            args = ['update', '--set', 'author=Test User', '--no-auto-author', '--cache', '--yes']
+            self.assertEqual(self._run_cli(args), 0)
+            self.assertTrue(os.path.exists('.metadata-cache.json'))
+
+            with patch('update_metadata.core.process_file') as mock_process:
+                self.assertEqual(self._run_cli(args), 0)
+                mock_process.assert_not_called()
+
+            with open(self.sample_file, 'a', encoding='utf-8') as f:
+                f.write("\nNew paragraph.\n")
+            with patch('update_metadata.core.process_file', return_value=True) as mock_process:
+                self.assertEqual(self._run_cli(args), 0)
+                self.assertEqual(mock_process.call_count, 1)
+        finally:
+            os.chdir(original_dir)
+
+    def test_bulk_cache_retries_failed_files(self):
+        """Test that --cache does not record files that could not be processed."""
+        original_dir = os.getcwd()
+        os.chdir(self.test_dir)
+
+        try:
+            bad_file = os.path.join('.', 'bad.md')
+            with open(bad_file, 'wb') as f:
+                f.write(b'# Bad \xff\xfe\n')
+
+            args = ['update', '--set', 'author=Test User', '--no-auto-author', '--cache', '--yes']
+            # Make the bad file undecodable whatever the locale
+            with patch('update_metadata.core.locale.getpreferredencoding', return_value='utf-8'):
+                self.assertEqual(self._run_cli(args), 0)
+
+            with patch('update_metadata.core.process_file', return_value=None) as mock_process:
+                self.assertEqual(self._run_cli(args), 0)
+                processed = [call.args[0] for call in mock_process.call_args_list]
+                self.assertEqual(processed, [bad_file])
+        finally:
+            os.chdir(original_dir)
+
+    def test_report_json(self):
+        """Test writing the project status as JSON."""
+        original_dir = os.getcwd()
+        os.chdir(self.test_dir)
+
+        try:
+            self.test_update_metadata()
+            report_path = os.path.join(self.test_dir, 'status.json')
+
+            result = self._run_cli(['report', '--json', '--output', report_path])
+            self.assertEqual(result, 0)
+
+            with open(report_path, 'r', encoding='utf-8') as f:
+                status = json.load(f)
+            self.assertEqual(status['files_with_metadata'], 1)
+            self.assertEqual(status['authors'], ['Test User'])
+            self.assertEqual(status['versions'], {'1.0.0': 1})
+        finally:
+            os.chdir(original_dir)
+
+    def test_report_cache(self):
+        """Test that report --cache reads only files changed since the last report."""
+        original_dir = os.getcwd()
+        os.chdir(self.test_dir)
+
+        try:
+            self.test_update_metadata()
+            report_path = os.path.join(self.test_dir, 'report.txt')
+            args = ['report', '--cache', '--jobs', '1', '--output', report_path]
+            self.assertEqual(self._run_cli(args), 0)
+            self.assertTrue(os.path.exists('.metadata-status-cache.json'))
+
+            with patch('update_metadata.core._read_file_metadata') as mock_read:
+                self.assertEqual(self._run_cli(args), 0)
+                mock_read.assert_not_called()
+
+            with open(report_path, 'r', encoding='utf-8') as f:
+                self.assertIn('- Test User: 1 files', f.read())
+        finally:
+            os.chdir(original_dir)
+
     def test_init_mdignore(self):
         """Test initializing .mdignore file."""
         # Change to test directory to create .mdignore there
@@ -127,5 +316,42 @@ class TestMetadataCLI(unittest.TestCase):
             os.chdir(original_dir)
 
 
+class TestPackageExports(unittest.TestCase):
+    """Test cases for the names exported by the package."""
+
+    def test_cli_is_main_after_submodule_import(self):
+        """Test that importing the cli submodule does not shadow the exported function."""
+        import update_metadata
+        import update_metadata.cli
+
+        self.assertIs(update_metadata.cli, cli_main)
+        namespace = {}
+        exec('from update_metadata import *', namespace)
+        self.assertIs(namespace['cli'], cli_main)
+
+
+class TestConfirm(unittest.TestCase):
+    """Test cases for the confirmation prompt."""
+
+    def _confirm(self, answer, default=False, tty=True):
+        """Helper method to answer the prompt once."""
+        with patch('sys.stdin.isatty', return_value=tty), \
+                patch('builtins.input', return_value=answer) as mock_input:
+            result = confirm('Continue?', default)
+        return result, mock_input.call_count
+
+    def test_answers(self):
+        """Test that yes/no answers are recognized and others use the default."""
+        self.assertEqual(self._confirm(' Yes '), (True, 1))
+        self.assertEqual(self._confirm('n', default=True), (False, 1))
+        self.assertEqual(self._confirm('', default=True), (True, 1))
+        self.assertEqual(self._confirm('maybe'), (False, 1))
+
+    def test_non_interactive(self):
+        """Test that the prompt is skipped when stdin is not a terminal."""
+        with patch('sys.stdout'):
+            self.assertEqual(self._confirm('y', tty=False), (False, 0))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Tests for the core metadata functions.
+"""
+
+import json
+import os
+import sys
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add the package directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from update_metadata.core import (
+    compile_ignore_matcher,
+    extract_metadata,
+    find_markdown_files,
+    get_git_author,
+    get_git_contributors,
+    load_ignore_patterns,
+    prefetch_git_authors,
+    process_file,
+    read_file,
+    should_ignore,
+    write_file,
+)
+
+
+class TestIgnorePatterns(unittest.TestCase):
+    """Test cases for ignore pattern loading and matching."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp()
+        self.ignore_file = os.path.join(self.test_dir, '.mdignore')
+
+    def tearDown(self):
+        """Clean up test environment."""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_should_ignore(self):
+        """Test matching paths against default and custom patterns."""
+        patterns = ['node_modules', '*.log', 'docs/drafts']
+        self.assertTrue(should_ignore('./node_modules/pkg/README.md', patterns))
+        self.assertTrue(should_ignore('./logs/build.log', patterns))
+        self.assertTrue(should_ignore('./docs/drafts/idea.md', patterns))
+        self.assertFalse(should_ignore('./docs/guide.md', patterns))
+        self.assertFalse(should_ignore('./README.md', []))
+
+    def test_compile_ignore_matcher(self):
+        """Test the name, suffix and glob fast paths of the compiled matcher."""
+        is_ignored = compile_ignore_matcher(['node_modules', '*.log', 'docs/*', 'tmp?'])
+        self.assertTrue(is_ignored('pkg/node_modules/README.md'))
+        self.assertTrue(is_ignored('logs/build.log/notes.md'))
+        self.assertTrue(is_ignored('docs/guide.md'))
+        self.assertTrue(is_ignored('src/tmp1/notes.md'))
+        self.assertFalse(is_ignored('src/node_modules.md'))
+        self.assertFalse(is_ignored('guide/docs.md'))
+
+    def test_gitignore_semantics(self):
+        """Test directory-only and anchored patterns."""
+        is_ignored = compile_ignore_matcher(['build/', '/drafts', 'notes/*.md'])
+        self.assertTrue(is_ignored('src/build/README.md'))
+        self.assertTrue(is_ignored('src/build', is_dir=True))
+        self.assertFalse(is_ignored('src/build'))
+        self.assertTrue(is_ignored('drafts/idea.md'))
+        self.assertFalse(is_ignored('docs/drafts/idea.md'))
+        self.assertTrue(is_ignored('notes/todo.md'))
+        self.assertFalse(is_ignored('docs/notes/todo.md'))
+
+    def test_nested_ignore_file(self):
+        """Test that an ignore file in a subdirectory only affects its subtree."""
+        for rel_path in ('a/drafts/x.md', 'a/keep.md', 'a/skip.md', 'b/drafts/y.md', 'b/skip.md'):
+            filepath = os.path.join(self.test_dir, rel_path)
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write("# Doc\n")
+        with open(os.path.join(self.test_dir, 'a', '.gitignore'), 'w', encoding='utf-8') as f:
+            f.write("drafts/\n/skip.md\n")
+
+        found = find_markdown_files(self.test_dir, [], nested_ignore_file='.gitignore')
+        rel_paths = [os.path.relpath(path, self.test_dir).replace(os.sep, '/') for path in found]
+        self.assertEqual(rel_paths, ['a/keep.md', 'b/drafts/y.md', 'b/skip.md'])
+
+    def test_load_ignore_patterns_reloads_changed_file(self):
+        """Test that edits to the ignore file are picked up."""
+        with open(self.ignore_file, 'w', encoding='utf-8') as f:
+            f.write("# comment\nfirst/\n")
+        patterns = load_ignore_patterns(self.ignore_file)
+        self.assertIn('first/', patterns)
+        self.assertNotIn('# comment', patterns)
+
+        with open(self.ignore_file, 'w', encoding='utf-8') as f:
+            f.write("second/\n")
+        stat = os.stat(self.ignore_file)
+        os.utime(self.ignore_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        patterns = load_ignore_patterns(self.ignore_file)
+        self.assertIn('second/', patterns)
+        self.assertNotIn('first/', patterns)
+
+
+class TestMetadataBlock(unittest.TestCase):
+    """Test cases for locating metadata blocks."""
+
+    def test_block_at_end(self):
+        """Test extracting the block that ends the document."""
+        content, metadata = extract_metadata('# Title\n\n<!-- METADATA\n{"author": "A"}\n-->\n')
+        self.assertEqual(content, '# Title\n\n')
+        self.assertEqual(metadata['author'], 'A')
+
+    def test_block_followed_by_text(self):
+        """Test that a block which does not end the document is still found."""
+        content, metadata = extract_metadata('<!-- metadata\n{"author": "A"}\n-->\nMore text\n')
+        self.assertEqual(content, '\nMore text\n')
+        self.assertEqual(metadata['author'], 'A')
+
+    def test_trailing_block_preferred(self):
+        """Test that the block at the end wins over an earlier one."""
+        _, metadata = extract_metadata(
+            '<!-- METADATA\n{"author": "A"}\n-->\nText\n<!-- METADATA\n{"author": "B"}\n-->\n'
+        )
+        self.assertEqual(metadata['author'], 'B')
+
+    def test_no_block(self):
+        """Test content without a metadata block."""
+        self.assertEqual(extract_metadata('Text <!-- note --> here\n'), ('Text <!-- note --> here\n', None))
+
+
+class TestProcessFile(unittest.TestCase):
+    """Test cases for updating a single file."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp()
+        self.sample_file = os.path.join(self.test_dir, 'test.md')
+
+    def tearDown(self):
+        """Clean up test environment."""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_string_fingerprint_is_upgraded(self):
+        """Test that a fingerprint stored as a JSON string is still read."""
+        fingerprint = json.dumps({
+            'content_hash': 'old',
+            'headers_hash': 'old',
+            'headers': json.dumps(['1:Title'])
+        })
+        block = json.dumps({'author': 'A', 'version': '1.0.0', '_fingerprint': fingerprint})
+        write_file(self.sample_file, f"# Title\n\nText\n\n<!-- METADATA\n{block}\n-->\n")
+
+        self.assertTrue(process_file(self.sample_file, auto_author=False))
+        _, metadata = extract_metadata(read_file(self.sample_file))
+        self.assertEqual(metadata['version'], '1.1.0')
+        self.assertEqual(metadata['_fingerprint']['headers'], ['1:Title'])
+
+        self.assertFalse(process_file(self.sample_file, auto_author=False))
+
+
+class TestWriteFile(unittest.TestCase):
+    """Test cases for writing files."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp()
+        self.sample_file = os.path.join(self.test_dir, 'test.md')
+
+    def tearDown(self):
+        """Clean up test environment."""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_replace_keeps_permissions(self):
+        """Test that rewriting a file keeps its mode and leaves no temp files."""
+        write_file(self.sample_file, "# Old\n")
+        os.chmod(self.sample_file, 0o640)
+
+        write_file(self.sample_file, "# New\n")
+
+        with open(self.sample_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), "# New\n")
+        self.assertEqual(os.stat(self.sample_file).st_mode & 0o777, 0o640)
+        self.assertEqual(os.listdir(self.test_dir), ['test.md'])
+
+    def test_read_only_directory(self):
+        """Test that a file is written in place when no temporary file can be created."""
+        write_file(self.sample_file, "# Old\n")
+
+        with patch('tempfile.mkstemp', side_effect=PermissionError):
+            write_file(self.sample_file, "# New\n")
+
+        with open(self.sample_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), "# New\n")
+
+    @unittest.skipUnless(hasattr(os, 'link'), "hard links are not supported")
+    def test_hard_links_are_kept(self):
+        """Test that a file with several hard links is rewritten in place."""
+        write_file(self.sample_file, "# Old\n")
+        link = os.path.join(self.test_dir, 'link.md')
+        os.link(self.sample_file, link)
+
+        write_file(self.sample_file, "# New\n")
+
+        with open(link, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), "# New\n")
+        self.assertTrue(os.path.samefile(self.sample_file, link))
+
+
+class TestGitHistory(unittest.TestCase):
+    """Test cases for authors read from the Git history."""
+
+    def setUp(self):
+        """Set up a repository with two commits by different authors."""
+        self.test_dir = os.path.realpath(tempfile.mkdtemp())
+        self.sample_file = os.path.join(self.test_dir, 'test.md')
+        self._git('init', '-q')
+        for name in ('First', 'Second'):
+            with open(self.sample_file, 'a', encoding='utf-8') as f:
+                f.write(f"# {name}\n")
+            self._git('add', 'test.md')
+            self._git(
+                '-c', f'user.name={name}', '-c', f'user.email={name.lower()}@example.com',
+                'commit', '-q', '-m', name
+            )
+
+    def tearDown(self):
+        """Clean up test environment."""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def _git(self, *args):
+        """Run a git command in the test repository."""
+        subprocess.run(['git', '-C', self.test_dir] + list(args), check=True)
+
+    def test_authors_from_history(self):
+        """Test the last author and the contributors, newest first."""
+        self.assertEqual(get_git_author(self.sample_file), 'Second <second@example.com>')
+        self.assertEqual(
+            get_git_contributors(self.sample_file),
+            ['Second <second@example.com>', 'First <first@example.com>']
+        )
+
+    def test_prefetch_authors(self):
+        """Test prefetching with pathspecs, with the whole history and after a failed log."""
+        expected = {self.sample_file: 'Second <second@example.com>'}
+        self.assertEqual(prefetch_git_authors([self.sample_file]), expected)
+
+        # A failed log falls back to one lookup per file
+        with patch('update_metadata.core._start_git_log', return_value=None):
+            self.assertEqual(prefetch_git_authors([self.sample_file]), expected)
+
+        with patch('update_metadata.core.GIT_PATHSPEC_LIMIT', 0):
+            self.assertEqual(prefetch_git_authors([self.sample_file]), expected)
+
+    def test_prefetch_upper_case_extension(self):
+        """Test that the whole-history read includes extensions in upper case."""
+        upper_file = os.path.join(self.test_dir, 'README.MD')
+        with open(upper_file, 'w', encoding='utf-8') as f:
+            f.write("# Readme\n")
+        self._git('add', 'README.MD')
+        self._git('-c', 'user.name=Third', '-c', 'user.email=third@example.com', 'commit', '-q', '-m', 'Readme')
+
+        with patch('update_metadata.core.GIT_PATHSPEC_LIMIT', 0):
+            authors = prefetch_git_authors([upper_file])
+        self.assertEqual(authors.get(upper_file), 'Third <third@example.com>')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,51 +8,83 @@ including version control integration, author detection, and bulk processing.
 # Version of the package
 __version__ = "1.1.0"
 
-# Import core functionality
-from .core import (
+import importlib
+
+# Public names are imported on first access (PEP 562), so that loading the
+# package for one command does not pull in everything else.
+# Maps each name to its (submodule, attribute) pair.
+_LAZY = {
     # File operations
-    read_file,
-    write_file,
+    'read_file': ('core', 'read_file'),
+    'write_file': ('core', 'write_file'),
 
     # Metadata processing
-    parse_metadata,
-    extract_metadata,
-    format_metadata,
-    add_or_update_metadata,
-    remove_metadata,
-    get_content_without_metadata,
+    'parse_metadata': ('core', 'parse_metadata'),
+    'extract_metadata': ('core', 'extract_metadata'),
+    'format_metadata': ('core', 'format_metadata'),
+    'current_timestamp': ('core', 'current_timestamp'),
+    'add_or_update_metadata': ('core', 'add_or_update_metadata'),
+    'remove_metadata': ('core', 'remove_metadata'),
+    'get_content_without_metadata': ('core', 'get_content_without_metadata'),
 
     # Version control
-    analyze_document_changes,
-    increment_version,
+    'analyze_document_changes': ('core', 'analyze_document_changes'),
+    'increment_version': ('core', 'increment_version'),
 
     # Author detection
-    get_author_info,
-    determine_author,
-    get_git_author,
-    get_git_contributors,
-    get_system_author,
-    get_file_system_author,
-    is_git_repository,
+    'get_author_info': ('core', 'get_author_info'),
+    'determine_author': ('core', 'determine_author'),
+    'get_git_author': ('core', 'get_git_author'),
+    'get_git_contributors': ('core', 'get_git_contributors'),
+    'get_system_author': ('core', 'get_system_author'),
+    'get_file_system_author': ('core', 'get_file_system_author'),
+    'is_git_repository': ('core', 'is_git_repository'),
+    'find_git_root': ('core', 'find_git_root'),
+    'prefetch_git_authors': ('core', 'prefetch_git_authors'),
 
     # File operations
-    find_markdown_files,
-    load_ignore_patterns,
-    should_ignore,
+    'find_markdown_files': ('core', 'find_markdown_files'),
+    'iter_markdown_files': ('core', 'iter_markdown_files'),
+    'load_ignore_patterns': ('core', 'load_ignore_patterns'),
+    'should_ignore': ('core', 'should_ignore'),
+    'compile_ignore_matcher': ('core', 'compile_ignore_matcher'),
+    'is_markdown_file': ('core', 'is_markdown_file'),
 
     # Processing functions
-    process_file,
-    process_bulk,
+    'process_file': ('core', 'process_file'),
+    'process_bulk': ('core', 'process_bulk'),
+    'map_files': ('core', 'map_files'),
 
     # Report and utility functions
-    create_ignore_file,
-    get_project_status,
-    generate_project_report,
-)
+    'create_ignore_file': ('core', 'create_ignore_file'),
+    'get_project_status': ('core', 'get_project_status'),
+    'dump_project_status': ('core', 'dump_project_status'),
+    'generate_project_report': ('core', 'generate_project_report'),
+    'iter_project_report': ('core', 'iter_project_report'),
+}
+
 
-# Import CLI if needed
+# Bound eagerly: importing the update_metadata.cli submodule (as the console
+# script does) sets the package attribute to the module, which would shadow a
+# lazy name. cli.py imports the core module only when a command runs.
 from .cli import main as cli
 
+
+def __getattr__(name):
+    """Import public names lazily on first access."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
 # Define what gets imported with 'from update_metadata import *'
 __all__ = [
     # Version
@@ -64,6 +96,7 @@ __all__ = [
     'parse_metadata',
     'extract_metadata',
     'format_metadata',
+    'current_timestamp',
     'add_or_update_metadata',
     'remove_metadata',
     'get_content_without_metadata',
@@ -76,14 +109,22 @@ __all__ = [
     'get_system_author',
     'get_file_system_author',
     'is_git_repository',
+    'find_git_root',
+    'prefetch_git_authors',
     'find_markdown_files',
+    'iter_markdown_files',
     'load_ignore_patterns',
     'should_ignore',
+    'compile_ignore_matcher',
+    'is_markdown_file',
     'process_file',
     'process_bulk',
+    'map_files',
     'create_ignore_file',
     'get_project_status',
+    'dump_project_status',
     'generate_project_report',
+    'iter_project_report',
 
     # CLI
     'cli',
@@ -1,19 +1,55 @@
-from update_metadata.core import (
-    find_markdown_files,
-    process_file,
-    process_bulk,
-    generate_project_report,
-    create_ignore_file,
-    load_ignore_patterns,
-)
 import sys
 import os
 import argparse
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from typing import List, Dict, Any
 
+# Accepted answers for confirmation prompts
+_YES = frozenset({'y', 'yes'})
+_NO = frozenset({'n', 'no'})
+
 
 def main():
     """Main CLI entry point."""
+    # Only the requested command's parser is built; the full tree is needed
+    # just for top-level help and usage errors
+    argv = sys.argv[1:]
+    if argv and argv[0] in _COMMANDS:
+        args = _build_command_parser(argv[0]).parse_args(argv[1:])
+        args.command = argv[0]
+    else:
+        args = _build_parser().parse_args(argv)
+
+    # The subparsers are required, so args.command is always a known command
+    return _HANDLERS[args.command](args)
+
+
+@contextmanager
+def _block_buffered_stdout():
+    """
+    Switch a line-buffered stdout to block buffering for the duration.
+
+    The output of each file is then written in one chunk, flushed by
+    map_files() once the file is done, instead of one write per line;
+    input() still flushes before a confirmation prompt.
+    """
+    reconfigure = getattr(sys.stdout, 'reconfigure', None)
+    if reconfigure is None or not sys.stdout.line_buffering:
+        yield
+        return
+
+    stream = sys.stdout
+    reconfigure(line_buffering=False)
+    try:
+        yield
+    finally:
+        stream.reconfigure(line_buffering=True)
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the full argument parser once and reuse it for later calls."""
     parser = argparse.ArgumentParser(
         description="Manage metadata in markdown files.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -35,24 +71,47 @@ Examples:
   metadata-py init-mdignore"""
     )
 
-    # Common arguments for all commands
+    # Subparsers for different commands
+    subparsers = parser.add_subparsers(dest='command', help='Command to execute', required=True)
+    for command, (help_text, add_arguments) in _COMMANDS.items():
+        add_arguments(subparsers.add_parser(
+            command,
+            help=help_text,
+            parents=[_build_common_parser()]
+        ))
+
+    return parser
+
+
+@lru_cache(maxsize=None)
+def _build_command_parser(command: str) -> argparse.ArgumentParser:
+    """Build a standalone parser for a single command."""
+    help_text, add_arguments = _COMMANDS[command]
+    parser = argparse.ArgumentParser(
+        prog=f"{os.path.basename(sys.argv[0])} {command}",
+        description=help_text,
+        parents=[_build_common_parser()]
+    )
+    add_arguments(parser)
+    return parser
+
+
+@lru_cache(maxsize=1)
+def _build_common_parser() -> argparse.ArgumentParser:
+    """Build the parent parser with arguments shared by all commands."""
     common_parser = argparse.ArgumentParser(add_help=False)
     common_parser.add_argument(
         '--verbose',
         '-v',
         action='store_true',
+        default=False,
         help='Show verbose output including author detection details'
     )
+    return common_parser
 
-    # Subparsers for different commands
-    subparsers = parser.add_subparsers(dest='command', help='Command to execute', required=True)
 
-    # Update command
-    update_parser = subparsers.add_parser(
-        'update',
-        help='Update metadata in markdown files',
-        parents=[common_parser]
-    )
+def _add_update_arguments(update_parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the update command."""
     update_parser.add_argument(
         'files',
         nargs='*',
@@ -98,6 +157,13 @@ Examples:
         '--ignore-file',
         help='Path to ignore file (default: .gitignore if exists)'
     )
+    update_parser.add_argument(
+        '--nested-ignore-files',
+        action='store_true',
+        default=False,
+        help='Also apply ignore files of the same name found in subdirectories, '
+             'each to its own subtree (bulk mode)'
+    )
     update_parser.add_argument(
         '--exclude-root',
         action='store_true',
@@ -110,6 +176,13 @@ Examples:
         default=False,
         help='Disable automatic author detection'
     )
+    update_parser.add_argument(
+        '--cache',
+        action='store_true',
+        default=False,
+        help='Skip files unchanged since the last run with the same options '
+             '(bulk mode, recorded in .metadata-cache.json)'
+    )
     update_parser.add_argument(
         '--yes',
         '-y',
@@ -117,25 +190,50 @@ Examples:
         default=False,
         help='Skip confirmation prompts'
     )
-
-    # Report command
-    report_parser = subparsers.add_parser(
-        'report',
-        help='Generate a report about markdown files',
-        parents=[common_parser]
+    update_parser.add_argument(
+        '--jobs',
+        '-j',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Number of worker processes (default: number of CPUs, 1 disables parallelism)'
     )
+
+
+def _add_report_arguments(report_parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the report command."""
     report_parser.add_argument(
         '--output',
         '-o',
+        default=None,
         help='Output file for the report (default: print to stdout)'
     )
-
-    # Init command
-    init_parser = subparsers.add_parser(
-        'init-mdignore',
-        help='Create a default .mdignore file',
-        parents=[common_parser]
+    report_parser.add_argument(
+        '--jobs',
+        '-j',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Number of threads reading files (default: number of CPUs + 4, at most 32; '
+             '1 disables parallelism)'
+    )
+    report_parser.add_argument(
+        '--cache',
+        action='store_true',
+        default=False,
+        help='Reuse the metadata of files unchanged since the last report '
+             '(recorded in .metadata-status-cache.json)'
+    )
+    report_parser.add_argument(
+        '--json',
+        action='store_true',
+        default=False,
+        help='Print the project status as JSON instead of the text report'
     )
+
+
+def _add_init_arguments(init_parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the init-mdignore command."""
     init_parser.add_argument(
         '--force',
         '-f',
@@ -144,66 +242,85 @@ Examples:
         help='Overwrite existing .mdignore file'
     )
 
-    # Parse arguments
-    args = parser.parse_args()
-
-    # Ensure all commands have a verbose attribute
-    if not hasattr(args, 'verbose'):
-        args.verbose = False
 
-    # Handle different commands
-    if args.command == 'update':
-        return handle_update_command(args)
-    elif args.command == 'report':
-        return handle_report_command(args)
-    elif args.command == 'init-mdignore':
-        return handle_init_command(args)
-    else:
-        parser.error(f"Unknown command: {args.command}")
+# Available commands: name -> (help text, function adding the command's arguments)
+_COMMANDS = {
+    'update': ('Update metadata in markdown files', _add_update_arguments),
+    'report': ('Generate a report about markdown files', _add_report_arguments),
+    'init-mdignore': ('Create a default .mdignore file', _add_init_arguments),
+}
 
 
+@_block_buffered_stdout()
 def handle_update_command(args):
     """Handle the update command."""
-    # Parse metadata from --set arguments
-    new_metadata = {}
-    if args.set:
-        for item in args.set:
-            if '=' not in item:
-                print(f"Error: Invalid metadata format: {item}. Use KEY=VALUE format.")
-                return 1
-            key, value = item.split('=', 1)
-            new_metadata[key.strip()] = value.strip()
+    # Parse metadata from --set arguments before any other work, so invalid
+    # input fails without importing the core module or touching the disk
+    pairs = [item.partition('=') for item in args.set]
+    for item, sep, _ in pairs:
+        if not sep:
+            print(f"Error: Invalid metadata format: {item}. Use KEY=VALUE format.")
+            return 1
+    new_metadata = {key.strip(): value.strip() for key, _, value in pairs}
+
+    from update_metadata.core import (
+        find_markdown_files,
+        is_markdown_file,
+        INODE_ORDER,
+        CACHE_FILENAME,
+        current_timestamp,
+        process_file,
+        process_bulk,
+        map_files,
+        prefetch_git_authors,
+        load_ignore_patterns,
+    )
 
     # Determine files to process
     if args.files:
         # Process specific files
         files_to_process = []
+        warnings = []
         for filepath in args.files:
-            if not os.path.exists(filepath):
-                print(f"Warning: File not found: {filepath}")
-                continue
-            if not filepath.lower().endswith(('.md', '.markdown')):
-                print(f"Warning: Not a markdown file: {filepath}")
+            # Missing files are reported by process_file when it opens them
+            if not is_markdown_file(filepath):
+                warnings.append(f"Warning: Not a markdown file: {filepath}\n")
                 continue
             files_to_process.append(filepath)
 
+        # Emit all warnings with one write instead of one print per file
+        if warnings:
+            sys.stdout.writelines(warnings)
+
         if not files_to_process:
             print("No valid markdown files to process.")
             return 1
 
+        # Look up Git authors for all files at once instead of per file
+        git_authors = None
+        if not args.no_auto_author and 'author' not in new_metadata and not args.remove:
+            git_authors = prefetch_git_authors(files_to_process)
+
         # Process individual files
-        modified_count = 0
-        for filepath in files_to_process:
-            if process_file(
-                filepath,
-                new_metadata,
-                args.remove,
-                args.overwrite,
-                args.dry_run,
-                not args.no_auto_author,
-                args.verbose
-            ):
-                modified_count += 1
+        process = partial(
+            process_file,
+            new_metadata=new_metadata,
+            remove=args.remove,
+            overwrite=args.overwrite,
+            dry_run=args.dry_run,
+            auto_author=not args.no_auto_author,
+            verbose=args.verbose,
+            git_authors=git_authors,
+            now=current_timestamp()
+        )
+        # Files are independent, so they are spread across worker processes;
+        # serial processing keeps verbose output in file order. Executor.map
+        # submits its whole input up front, so the validated list (also
+        # needed for the Git prefetch and the totals) is passed as is rather
+        # than streamed from a generator.
+        jobs = 1 if args.verbose else _resolve_jobs(args)
+        results = map_files(process, files_to_process, jobs)
+        modified_count = sum(1 for modified in results if modified)
 
         if args.dry_run:
             print(f"\nDry run completed: {modified_count}/{len(files_to_process)} files would be modified")
@@ -215,19 +332,23 @@ def handle_update_command(args):
         root_dir = "."
 
         # Handle ignore patterns
-        ignore_patterns = None
-        if args.ignore:
-            ignore_patterns = load_ignore_patterns(args.ignore_file)
-            ignore_patterns.extend(args.ignore)
+        ignore_patterns = load_ignore_patterns(args.ignore_file)
+        ignore_patterns.extend(args.ignore)
+
+        # Walk the tree once; process_bulk reuses this list
+        markdown_files = find_markdown_files(
+            root_dir,
+            ignore_patterns,
+            not args.exclude_root,
+            args.verbose,
+            by_inode=INODE_ORDER,
+            nested_ignore_file=(
+                os.path.basename(args.ignore_file or '.gitignore') if args.nested_ignore_files else None
+            )
+        )
 
         # Confirmation prompt
         if not args.yes and not args.dry_run:
-            markdown_files = find_markdown_files(
-                root_dir,
-                ignore_patterns or load_ignore_patterns(args.ignore_file),
-                not args.exclude_root,
-                args.verbose
-            )
             print(f"Found {len(markdown_files)} markdown files to process.")
             if not confirm("Do you want to continue?"):
                 print("Operation cancelled.")
@@ -244,7 +365,10 @@ def handle_update_command(args):
             verbose=args.verbose,
             ignore_patterns=ignore_patterns,
             include_root=not args.exclude_root,
-            ignore_file=args.ignore_file
+            ignore_file=args.ignore_file,
+            markdown_files=markdown_files,
+            jobs=_resolve_jobs(args),
+            cache_file=os.path.join(root_dir, CACHE_FILENAME) if args.cache else None
         )
 
         if args.dry_run:
@@ -257,37 +381,79 @@ def handle_update_command(args):
 
 def handle_report_command(args):
     """Handle the report command."""
+    from update_metadata.core import (
+        iter_project_report,
+        get_project_status,
+        dump_project_status,
+        STATUS_CACHE_FILENAME,
+    )
+
+    # Threads mostly wait on reads, so more of them than CPUs pay off
+    # (the same default as ThreadPoolExecutor)
+    jobs = args.jobs or min(32, (os.cpu_count() or 1) + 4)
+    cache_file = STATUS_CACHE_FILENAME if args.cache else None
     try:
-        report = generate_project_report(".", args.output if hasattr(args, 'output') else None)
-        if not hasattr(args, 'output') or not args.output:
-            print(report)
+        # The tree is walked once; both output formats are built from this status
+        status = get_project_status(".", jobs=jobs, cache_file=cache_file)
+        if args.json:
+            # The status itself, for tools; no text report is assembled
+            sections = [dump_project_status(status), '\n']
+        else:
+            # Stream the report section by section instead of building one string
+            sections = iter_project_report(".", status=status)
+
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.writelines(sections)
+            print(f"Report saved to: {args.output}")
+        else:
+            sys.stdout.writelines(sections)
+            if not args.json:
+                sys.stdout.write('\n')
         return 0
     except Exception as e:
-        print(f"Error generating report: {e}")
-        if args.verbose:
-            import traceback
-            traceback.print_exc()
-        return 1
+        return _report_error(f"Error generating report: {e}", args.verbose)
 
 
 def handle_init_command(args):
     """Handle the init-mdignore command."""
+    from update_metadata.core import create_ignore_file
+
     try:
         mdignore_path = ".mdignore"
 
         # Check if file exists and force flag
-        if os.path.exists(mdignore_path) and not getattr(args, 'force', False):
+        if os.path.exists(mdignore_path) and not args.force:
             print(f"File {mdignore_path} already exists. Use --force to overwrite.")
             return 1
 
         create_ignore_file(mdignore_path)
         return 0
     except Exception as e:
-        print(f"Error creating .mdignore file: {e}")
-        if args.verbose:
-            import traceback
-            traceback.print_exc()
-        return 1
+        return _report_error(f"Error creating .mdignore file: {e}", args.verbose)
+
+
+def _resolve_jobs(args) -> int:
+    """Return the --jobs value, defaulting to the number of CPUs."""
+    return args.jobs or os.cpu_count() or 1
+
+
+# Command name -> handler
+_HANDLERS = {
+    'update': handle_update_command,
+    'report': handle_report_command,
+    'init-mdignore': handle_init_command,
+}
+
+
+def _report_error(message: str, verbose: bool) -> int:
+    """Print a command error, with the traceback in verbose mode, and return 1."""
+    print(message)
+    if verbose:
+        # Only needed on this path, so it is not imported at startup
+        import traceback
+        traceback.print_exc()
+    return 1
 
 
 def confirm(prompt: str = 'Continue?', default: bool = False) -> bool:
@@ -299,25 +465,30 @@ def confirm(prompt: str = 'Continue?', default: bool = False) -> bool:
         default: The default value if the user just presses Enter
 
     Returns:
-        bool: True if the user confirmed, False otherwise
+        bool: True if the user confirmed, False otherwise (any answer other
+        than yes or no counts as the default, as does non-interactive stdin)
     """
+    # Without a terminal there is nobody to answer, so skip the prompt
+    if not sys.stdin.isatty():
+        print(f"{prompt} {'yes' if default else 'no'} (stdin is not a terminal; use --yes to confirm)")
+        return default
+
     if default:
         prompt = f"{prompt} [Y/n] "
     else:
         prompt = f"{prompt} [y/N] "
 
-    while True:
-        try:
-            response = input(prompt).strip().lower()
-            if not response:
-                return default
-            if response in ('y', 'yes'):
-                return True
-            if response in ('n', 'no'):
-                return False
-        except (KeyboardInterrupt, EOFError):
-            print()
-            return False
+    try:
+        response = input(prompt).strip().lower()
+    except (KeyboardInterrupt, EOFError):
+        print()
+        return False
+
+    if response in _YES:
+        return True
+    if response in _NO:
+        return False
+    return default
 
 
 if __name__ == '__main__':
@@ -10,28 +10,25 @@ import os
 import re
 import json
 import hashlib
-import argparse
-import subprocess
-import getpass
+import locale
 import fnmatch
-from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
+import mmap
+import stat
+import sys
+import time
+from collections import Counter, defaultdict
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Set
+
+# subprocess is imported where Git is run; annotations only need the name
+if TYPE_CHECKING:
+    import subprocess
 
+# orjson is an optional, much faster drop-in for the JSON in metadata blocks
 try:
-    from packaging import version
+    import orjson
 except ImportError:
-    import subprocess
-    import sys
-
-    def install_package(package):
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-
-    try:
-        install_package("packaging")
-        from packaging import version
-    except Exception as e:
-        print("Warning: Could not install packaging module. Using fallback version comparison.")
+    orjson = None
 
 # Default metadata template
 DEFAULT_METADATA = {
@@ -68,6 +65,199 @@ METADATA_PATTERN = re.compile(
     re.IGNORECASE | re.MULTILINE
 )
 
+# Cheap probe for the opening of a metadata block, used before the full pattern
+_METADATA_MARKER = re.compile(r'<!--\s*METADATA', re.IGNORECASE)
+_METADATA_MARKER_BYTES = re.compile(rb'<!--\s*METADATA', re.IGNORECASE)
+
+# Metadata blocks written by this tool end the file; this much of the end is checked first
+METADATA_TAIL_SIZE = 64 * 1024
+
+# Files larger than this are scanned through a memory map instead of being read
+MMAP_THRESHOLD = 256 * 1024
+
+# Text longer than this (in characters) is hashed in pieces of this size
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Default name of the process_bulk() cache file, relative to the root directory
+CACHE_FILENAME = '.metadata-cache.json'
+
+# Default name of the get_project_status() cache file, relative to the root directory
+STATUS_CACHE_FILENAME = '.metadata-status-cache.json'
+
+# Recorded in the status cache; change it when the cached entries change shape
+_STATUS_CACHE_KEY = 'status-1'
+
+# Per repository root: last commit author and all contributors of each markdown file
+_git_history_cache: Dict[str, Tuple[Dict[str, str], Dict[str, List[str]]]] = {}
+
+# Below this many files the cost of starting worker processes outweighs the gain
+PARALLEL_THRESHOLD = 4
+
+# Inode numbers roughly follow on-disk layout only on Linux filesystems
+INODE_ORDER = sys.platform.startswith('linux')
+
+# File extensions treated as markdown (compared in lowercase)
+MARKDOWN_EXTENSIONS = frozenset(('.md', '.markdown'))
+
+# Regular expression to match markdown headers
+HEADER_PATTERN = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
+
+# Header lines as extract_headers() reads them: surrounding whitespace ignored,
+# the text running to the last non-space character of the line
+_HEADER_LINE_PATTERN = re.compile(r'^[^\S\n]*(#{1,6})[^\S\n]+(\S(?:[^\n]*\S)?)', re.MULTILINE)
+
+
+def compile_ignore_matcher(patterns: Iterable[str]) -> Callable[..., bool]:
+    """
+    Compile ignore patterns into a function testing '/'-separated relative paths.
+
+    Patterns follow .gitignore rules: a trailing slash matches directories
+    only, and a pattern with a leading or inner slash is anchored to the
+    root and tested against the path and each of its parent directories.
+    Any other pattern matches a single path component; plain names such as
+    node_modules are looked up in a set and *.ext patterns are tested with
+    str.endswith, so only the remaining globs go through a combined regex.
+
+    Args:
+        patterns: Ignore patterns in .gitignore syntax (negation is not supported)
+
+    Returns:
+        Function taking a relative path and whether that path is a directory
+        (False by default), returning True for paths that should be ignored
+    """
+    return _compile_ignore_matcher(tuple(patterns))
+
+
+# Characters that make a pattern a glob rather than a plain name
+_GLOB_CHARS = re.compile(r'[*?\[]')
+
+# Names are compared in lowercase where the filesystem ignores case
+# (os.path.normcase would also turn '/' into '\\' on Windows)
+_fold_case = str.lower if os.path.normcase('A') != 'A' else str
+
+# Plain names, *.ext suffixes, component glob match and anchored path glob match
+_IgnoreRules = Tuple[frozenset, Tuple[str, ...], Optional[Callable], Optional[Callable]]
+
+
+def _glob_match(globs: List[str]) -> Optional[Callable]:
+    """Combine globs into the match method of one regex, or None if there are none."""
+    if not globs:
+        return None
+    return re.compile('|'.join(f"(?:{fnmatch.translate(glob)})" for glob in globs)).match
+
+
+def _build_ignore_rules(patterns: List[str]) -> _IgnoreRules:
+    names = set()
+    suffixes = []
+    globs = []
+    anchored = []
+    for pattern in patterns:
+        if '/' in pattern:
+            anchored.append(pattern.lstrip('/'))
+        elif not _GLOB_CHARS.search(pattern):
+            names.add(pattern)
+        elif pattern.startswith('*') and not _GLOB_CHARS.search(pattern, 1):
+            suffixes.append(pattern[1:])
+        else:
+            globs.append(pattern)
+    return frozenset(names), tuple(suffixes), _glob_match(globs), _glob_match(anchored)
+
+
+@lru_cache(maxsize=128)
+def _ignore_rules(patterns: Tuple[str, ...]) -> Tuple[_IgnoreRules, _IgnoreRules]:
+    """Split de-duplicated patterns into rules for any entry and for directories only."""
+    any_patterns = []
+    dir_patterns = []
+    for pattern in dict.fromkeys(patterns):
+        pattern = _fold_case(pattern)
+        if pattern.endswith('/'):
+            pattern = pattern.rstrip('/')
+            if pattern:
+                dir_patterns.append(pattern)
+        else:
+            any_patterns.append(pattern)
+    return _build_ignore_rules(any_patterns), _build_ignore_rules(dir_patterns)
+
+
+def _match_ignore_rules(rules: _IgnoreRules, rel_path: str, name: str) -> bool:
+    names, suffixes, match, anchored_match = rules
+    if name in names:
+        return True
+    if suffixes and name.endswith(suffixes):
+        return True
+    if match is not None and match(name):
+        return True
+    return anchored_match is not None and anchored_match(rel_path) is not None
+
+
+@lru_cache(maxsize=128)
+def _compile_ignore_matcher(patterns: Tuple[str, ...]) -> Callable[..., bool]:
+    is_ignored = _compile_entry_matcher(patterns)
+
+    def matcher(rel_path: str, is_dir: bool = False) -> bool:
+        parts = rel_path.split('/')
+        last = len(parts) - 1
+        partial_path = None
+        for i, part in enumerate(parts):
+            partial_path = part if partial_path is None else f"{partial_path}/{part}"
+            # Every component but the last is a directory
+            if is_ignored(partial_path, part, is_dir or i < last):
+                return True
+        return False
+
+    return matcher
+
+
+def _compile_entry_matcher(patterns: Tuple[str, ...]) -> Callable[..., bool]:
+    """
+    Like compile_ignore_matcher(), for a walk that has already checked every parent.
+
+    Only the entry's own name and its full relative path can still match,
+    so the returned function takes both (and whether the entry is a
+    directory) and skips the parent checks.
+    """
+    any_rules, dir_rules = _ignore_rules(patterns)
+    has_dir_rules = any(dir_rules)
+
+    def matcher(rel_path: str, name: str, is_dir: bool = False) -> bool:
+        rel_path = _fold_case(rel_path)
+        name = _fold_case(name)
+        if _match_ignore_rules(any_rules, rel_path, name):
+            return True
+        return is_dir and has_dir_rules and _match_ignore_rules(dir_rules, rel_path, name)
+
+    return matcher
+
+
+def is_markdown_file(filename: str) -> bool:
+    """Check whether a file name or path has a markdown extension, in any case."""
+    # Only the extension is lowercased, not the whole path
+    return os.path.splitext(filename)[1].lower() in MARKDOWN_EXTENSIONS
+
+
+def _dumps_metadata(metadata: Dict) -> str:
+    """Serialize metadata as pretty-printed JSON, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(metadata, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except TypeError:
+            # Values orjson cannot serialize go through the standard library
+            pass
+    return json.dumps(metadata, indent=2, ensure_ascii=False)
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps_compact(value) -> str:
+    """Serialize JSON without indentation (for cache files), using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(value)
+
 
 def load_ignore_patterns(ignore_file: Optional[str] = None) -> List[str]:
     """
@@ -85,20 +275,36 @@ def load_ignore_patterns(ignore_file: Optional[str] = None) -> List[str]:
     if ignore_file is None:
         ignore_file = '.gitignore'
 
-    if os.path.exists(ignore_file):
-        try:
-            with open(ignore_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        patterns.append(line)
-        except Exception as e:
-            print(f"Warning: Could not read ignore file {ignore_file}: {e}")
+    try:
+        mtime = os.stat(ignore_file).st_mtime_ns
+    except OSError:
+        return patterns
 
+    patterns.extend(_read_ignore_file(os.path.abspath(ignore_file), mtime))
     return patterns
 
 
-def should_ignore(filepath: str, ignore_patterns: List[str], project_root: str = ".") -> bool:
+@lru_cache(maxsize=32)
+def _read_ignore_file(ignore_file: str, mtime: int) -> Tuple[str, ...]:
+    """Read patterns from an ignore file, cached until the file changes."""
+    patterns = []
+    try:
+        with open(ignore_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    patterns.append(line)
+    except Exception as e:
+        print(f"Warning: Could not read ignore file {ignore_file}: {e}")
+    return tuple(patterns)
+
+
+def should_ignore(
+    filepath: str,
+    ignore_patterns: List[str],
+    project_root: str = ".",
+    is_dir: bool = False
+) -> bool:
     """
     Check if a file should be ignored based on patterns.
 
@@ -106,6 +312,7 @@ def should_ignore(filepath: str, ignore_patterns: List[str], project_root: str =
         filepath: Path to check
         ignore_patterns: List of ignore patterns
         project_root: Root directory of the project
+        is_dir: Whether filepath is a directory, for patterns ending in '/'
 
     Returns:
         True if file should be ignored
@@ -119,33 +326,17 @@ def should_ignore(filepath: str, ignore_patterns: List[str], project_root: str =
     # Normalize path separators
     rel_path = rel_path.replace('\\', '/')
 
-    for pattern in ignore_patterns:
-        # Remove leading slash if present
-        pattern = pattern.lstrip('/')
-
-        # Check if pattern matches the relative path or any part of it
-        if fnmatch.fnmatch(rel_path, pattern):
-            return True
-
-        # Check if any parent directory matches the pattern
-        path_parts = rel_path.split('/')
-        for i in range(len(path_parts)):
-            partial_path = '/'.join(path_parts[:i+1])
-            if fnmatch.fnmatch(partial_path, pattern):
-                return True
-
-            # Also check just the directory name
-            if fnmatch.fnmatch(path_parts[i], pattern):
-                return True
-
-    return False
+    return compile_ignore_matcher(ignore_patterns)(rel_path, is_dir)
 
 
 def find_markdown_files(
     root_dir: str = ".",
     ignore_patterns: Optional[List[str]] = None,
     include_root: bool = True,
-    verbose: bool = False
+    verbose: bool = False,
+    by_inode: bool = False,
+    sort: bool = True,
+    nested_ignore_file: Optional[str] = None
 ) -> List[str]:
     """
     Find all markdown files in the project, optionally including root files.
@@ -155,6 +346,12 @@ def find_markdown_files(
         ignore_patterns: Patterns to ignore
         include_root: Whether to include files in the root directory
         verbose: Whether to show verbose output
+        by_inode: Order files by inode number instead of path, so reading
+            them in order seeks less on spinning disks
+        sort: Whether to sort by path; if False (and not by_inode) the
+            files are returned in walk order
+        nested_ignore_file: Name of ignore files (such as .gitignore) whose
+            patterns apply to the subtree of the subdirectory holding them
 
     Returns:
         List of markdown file paths
@@ -162,104 +359,437 @@ def find_markdown_files(
     if ignore_patterns is None:
         ignore_patterns = DEFAULT_IGNORE_PATTERNS
 
-    markdown_files = []
+    # Compile the patterns once for the whole walk
+    is_ignored = _compile_entry_matcher(tuple(ignore_patterns))
+    entries = _iter_markdown_entries(
+        root_dir, is_ignored, include_root, verbose, nested_ignore_file=nested_ignore_file
+    )
+
+    if by_inode:
+        # DirEntry.inode() comes from the directory listing, without a stat
+        return [entry.path for entry in sorted(entries, key=os.DirEntry.inode)]
+    if sort:
+        return sorted(entry.path for entry in entries)
+    return [entry.path for entry in entries]
 
-    for root, dirs, files in os.walk(root_dir):
-        # Filter out ignored directories
-        dirs[:] = [d for d in dirs if not should_ignore(
-            os.path.join(root, d), ignore_patterns, root_dir
-        )]
 
-        for file in files:
-            if file.lower().endswith(('.md', '.markdown')):
-                filepath = os.path.join(root, file)
+def iter_markdown_files(
+    root_dir: str = ".",
+    ignore_patterns: Optional[List[str]] = None,
+    include_root: bool = True,
+    verbose: bool = False,
+    nested_ignore_file: Optional[str] = None
+) -> Iterator[str]:
+    """
+    Yield markdown file paths in walk order as the tree is walked.
 
-                # Skip if this file should be ignored
-                if should_ignore(filepath, ignore_patterns, root_dir):
-                    if verbose:
-                        print(f"Ignoring: {filepath}")
-                    continue
+    Unlike find_markdown_files(), nothing is collected or sorted, so the
+    first paths are available immediately and memory use does not grow
+    with the number of files.
 
-                # If not including root files, skip files in root directory
-                if not include_root and os.path.dirname(filepath) == root_dir:
-                    if verbose:
-                        print(f"Skipping root file: {filepath}")
-                    continue
+    Args:
+        root_dir: Root directory to search
+        ignore_patterns: Patterns to ignore
+        include_root: Whether to include files in the root directory
+        verbose: Whether to show verbose output
+        nested_ignore_file: Name of ignore files (such as .gitignore) whose
+            patterns apply to the subtree of the subdirectory holding them
 
-                markdown_files.append(filepath)
+    Returns:
+        Iterator over markdown file paths
+    """
+    if ignore_patterns is None:
+        ignore_patterns = DEFAULT_IGNORE_PATTERNS
 
-    return sorted(markdown_files)
+    is_ignored = _compile_entry_matcher(tuple(ignore_patterns))
+    entries = _iter_markdown_entries(
+        root_dir, is_ignored, include_root, verbose, nested_ignore_file=nested_ignore_file
+    )
+    for entry in entries:
+        yield entry.path
+
+
+def _iter_markdown_entries(
+    root_dir: str,
+    is_ignored: Callable[[str, str], bool],
+    include_root: bool = True,
+    verbose: bool = False,
+    current_dir: Optional[str] = None,
+    rel_dir: str = '',
+    nested_ignore_file: Optional[str] = None
+) -> Iterator[os.DirEntry]:
+    """
+    Walk the directory tree with os.scandir and yield markdown file entries.
+
+    Each DirEntry carries the file type (and, once requested, the stat
+    result) from the directory listing, so callers avoid extra stat calls.
+    Ignored directories are never descended into, so each entry is checked
+    only against its own name and relative path. Paths relative to root_dir
+    are built while descending, so ignore checks need no os.path.relpath.
+    A nested ignore file extends the matcher passed down to its own subtree
+    only, so other directories never evaluate its patterns.
+    """
+    if current_dir is None:
+        current_dir = root_dir
+
+    try:
+        with os.scandir(current_dir) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    # The root's ignore file is already part of the patterns
+    if nested_ignore_file is not None and rel_dir:
+        for entry in entries:
+            if entry.name == nested_ignore_file:
+                is_ignored = _with_local_ignore_file(is_ignored, entry.path, len(rel_dir) + 1)
+                break
+
+    subdirs = []
+    for entry in entries:
+        name = entry.name
+        try:
+            # Symlinked directories are not followed, like os.walk
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            is_dir = False
+
+        if is_dir:
+            rel_path = f"{rel_dir}/{name}" if rel_dir else name
+            if not is_ignored(rel_path, name, True):
+                subdirs.append((entry, rel_path))
+            continue
+
+        if not is_markdown_file(name):
+            continue
+
+        # A symlink to a directory is neither descended into nor a file
+        if entry.is_symlink() and entry.is_dir():
+            continue
+
+        # Skip if this file should be ignored
+        if is_ignored(f"{rel_dir}/{name}" if rel_dir else name, name):
+            if verbose:
+                print(f"Ignoring: {entry.path}")
+            continue
+
+        # If not including root files, skip files in root directory
+        if not include_root and current_dir == root_dir:
+            if verbose:
+                print(f"Skipping root file: {entry.path}")
+            continue
+
+        yield entry
+
+    for entry, rel_path in subdirs:
+        yield from _iter_markdown_entries(
+            root_dir, is_ignored, include_root, verbose, entry.path, rel_path, nested_ignore_file
+        )
+
+
+def _with_local_ignore_file(
+    is_ignored: Callable[..., bool], ignore_file: str, prefix_len: int
+) -> Callable[..., bool]:
+    """
+    Extend a walk matcher with the patterns of an ignore file inside the tree.
+
+    The file's patterns are matched against paths relative to its directory,
+    which are the walk's relative paths without their first prefix_len
+    characters.
+    """
+    try:
+        mtime = os.stat(ignore_file).st_mtime_ns
+    except OSError:
+        return is_ignored
+    patterns = _read_ignore_file(os.path.abspath(ignore_file), mtime)
+    if not patterns:
+        return is_ignored
+    is_locally_ignored = _compile_entry_matcher(patterns)
+
+    def matcher(rel_path: str, name: str, is_dir: bool = False) -> bool:
+        return is_ignored(rel_path, name, is_dir) or is_locally_ignored(rel_path[prefix_len:], name, is_dir)
+
+    return matcher
 
 
 def get_git_author(filepath: str) -> Optional[str]:
     """
     Get the author of the last commit that modified this file.
 
+    Served from the repository history cached by prefetch_git_authors() when
+    there is one; otherwise only this file's log is read.
+
     Returns:
         str: Git author name and email, or None if not available
     """
+    repo_root = find_git_root(filepath)
+    if repo_root is not None:
+        history = _git_history_cache.get(repo_root)
+        if history is not None:
+            author = history[0].get(os.path.abspath(filepath))
+        else:
+            authors = _git_file_authors(repo_root, filepath, 1)
+            author = authors[0] if authors else None
+        if author:
+            return author
+
+    # Fallback: get current git user config
+    return _git_config_author(repo_root or os.path.dirname(os.path.abspath(filepath)))
+
+
+@lru_cache(maxsize=None)
+def _git_config_author(directory: str) -> Optional[str]:
+    """Get the configured Git user as "name <email>" for a directory."""
+    # Only needed when Git is consulted, so it is not imported at startup
+    import subprocess
+
     try:
-        # Get the last commit author for this specific file
+        # Both settings come back from one git process
         result = subprocess.run([
-            'git', 'log', '-1', '--pretty=format:%an <%ae>', '--', filepath
-        ], capture_output=True, text=True, timeout=10)
+            'git', 'config', '--get-regexp', r'^user\.(name|email)$'
+        ], cwd=directory, capture_output=True, text=True, timeout=5)
+    except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError):
+        return None
 
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
+    if result.returncode != 0:
+        return None
 
-        # Fallback: get current git user config
-        name_result = subprocess.run([
-            'git', 'config', 'user.name'
-        ], capture_output=True, text=True, timeout=5)
+    # Later lines come from more specific config files and take precedence
+    values = {}
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(' ')
+        values[key.lower()] = value.strip()
 
-        email_result = subprocess.run([
-            'git', 'config', 'user.email'
-        ], capture_output=True, text=True, timeout=5)
+    name = values.get('user.name')
+    email = values.get('user.email')
+    if name and email:
+        return f"{name} <{email}>"
+    return None
 
-        if name_result.returncode == 0 and email_result.returncode == 0:
-            name = name_result.stdout.strip()
-            email = email_result.stdout.strip()
-            if name and email:
-                return f"{name} <{email}>"
 
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
-        pass
+def find_git_root(path: str) -> Optional[str]:
+    """Find the root of the Git repository containing path, if any."""
+    current = os.path.abspath(path)
+    if not os.path.isdir(current):
+        current = os.path.dirname(current)
+    return _git_root_for(current)
 
-    return None
 
+@lru_cache(maxsize=None)
+def _git_root_for(directory: str) -> Optional[str]:
+    """Walk up from an absolute directory to the one holding .git, once per directory."""
+    if os.path.exists(os.path.join(directory, '.git')):
+        return directory
+    parent = os.path.dirname(directory)
+    if parent == directory:
+        return None
+    # Sibling directories share their parents' cached answers
+    return _git_root_for(parent)
 
-def get_git_contributors(filepath: str) -> List[str]:
+
+def prefetch_git_authors(filepaths: List[str]) -> Dict[str, str]:
     """
-    Get all contributors who have modified this file.
+    Get the last commit author of many files with one git call per repository.
+
+    Repositories with more than GIT_PATHSPEC_LIMIT of the files have their
+    whole markdown history read once and cached; for fewer files only their
+    own history is read, with the files passed to git as pathspecs.
+
+    Args:
+        filepaths: Paths of the files that will be processed
 
     Returns:
-        List of contributor names and emails
+        Dict mapping absolute file paths to "name <email>" strings
     """
+    files_by_repo = defaultdict(list)
+    for filepath in filepaths:
+        repo_root = find_git_root(filepath)
+        if repo_root is not None:
+            files_by_repo[repo_root].append(filepath)
+
+    # Repositories not read yet have their logs run side by side
+    _load_git_histories([
+        repo_root for repo_root, paths in files_by_repo.items()
+        if repo_root not in _git_history_cache and len(paths) > GIT_PATHSPEC_LIMIT
+    ])
+
+    authors = {}
+    pending = []
+    for repo_root, paths in files_by_repo.items():
+        history = _git_history_cache.get(repo_root)
+        if history is not None:
+            authors.update(history[0])
+        elif len(paths) > GIT_PATHSPEC_LIMIT:
+            # Reading the whole history failed
+            _add_file_authors(authors, repo_root, paths)
+        else:
+            pending.append((repo_root, paths))
+
+    for i in range(0, len(pending), GIT_CONCURRENCY):
+        batch = pending[i:i + GIT_CONCURRENCY]
+        procs = [(repo_root, paths, _start_git_log(repo_root, paths)) for repo_root, paths in batch]
+        for repo_root, paths, proc in procs:
+            history = _finish_git_log(repo_root, proc)
+            if history is not None:
+                authors.update(history[0])
+            else:
+                _add_file_authors(authors, repo_root, paths)
+
+    return authors
+
+
+# Most git log processes prefetch_git_authors() runs at the same time
+GIT_CONCURRENCY = 8
+
+# Up to this many files of one repository are looked up with their paths as
+# pathspecs instead of reading the repository's whole markdown history
+GIT_PATHSPEC_LIMIT = 64
+
+
+def _load_git_histories(repo_roots: List[str]) -> None:
+    """Fill the history cache for several repositories, running their logs concurrently."""
+    for i in range(0, len(repo_roots), GIT_CONCURRENCY):
+        batch = repo_roots[i:i + GIT_CONCURRENCY]
+        procs = [(repo_root, _start_git_log(repo_root)) for repo_root in batch]
+        for repo_root, proc in procs:
+            history = _finish_git_log(repo_root, proc)
+            # A failed read is not cached, so each file is looked up on its own
+            if history is not None:
+                _git_history_cache[repo_root] = history
+
+
+def _add_file_authors(authors: Dict[str, str], repo_root: str, filepaths: List[str]) -> None:
+    """Look up the last commit author of each file with its own git call."""
+    for filepath in filepaths:
+        file_authors = _git_file_authors(repo_root, filepath, 1)
+        if file_authors:
+            authors[os.path.abspath(filepath)] = file_authors[0]
+
+
+def _git_file_authors(repo_root: str, filepath: str, max_commits: Optional[int] = None) -> List[str]:
+    """Read the authors of one file's commits (the newest max_commits), unique and newest first."""
+    import subprocess
+
+    command = ['git', '-C', repo_root, 'log', '--pretty=format:%an <%ae>']
+    if max_commits is not None:
+        command.append(f'-{max_commits}')
+    command += ['--', _literal_pathspec(repo_root, filepath)]
     try:
-        result = subprocess.run([
-            'git', 'log', '--pretty=format:%an <%ae>', '--follow', '--', filepath
-        ], capture_output=True, text=True, timeout=15)
+        result = subprocess.run(command, capture_output=True, text=True, timeout=30)
+    except subprocess.TimeoutExpired:
+        print(f"Warning: Reading the Git history of {filepath} timed out")
+        return []
+    except (subprocess.SubprocessError, OSError):
+        return []
+
+    if result.returncode != 0:
+        return []
+    # Dicts keep insertion order, giving unique authors newest first
+    return list(dict.fromkeys(line for line in result.stdout.split('\n') if line))
+
+
+def _literal_pathspec(repo_root: str, filepath: str) -> str:
+    """Name a file to git relative to its repository, with glob characters taken literally."""
+    rel_path = os.path.relpath(os.path.abspath(filepath), repo_root)
+    return ':(literal)' + rel_path.replace(os.sep, '/')
+
+
+def _start_git_log(
+    repo_root: str, filepaths: Optional[List[str]] = None
+) -> Optional['subprocess.Popen']:
+    """
+    Start listing the markdown history of a repository, without waiting for it.
+
+    With filepaths, only the history of those files is listed.
+    """
+    import subprocess
+
+    if filepaths is None:
+        # Extensions match in any case, like is_markdown_file()
+        pathspecs = [':(icase)*.md', ':(icase)*.markdown']
+    else:
+        pathspecs = [_literal_pathspec(repo_root, filepath) for filepath in filepaths]
+    try:
+        return subprocess.Popen([
+            'git', '-C', repo_root, '-c', 'core.quotePath=false', 'log',
+            '--name-only', '--pretty=format:%x01%an <%ae>', '--'
+        ] + pathspecs, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+           encoding='utf-8', errors='replace')
+    except (subprocess.SubprocessError, OSError):
+        return None
+
+
+def _finish_git_log(
+    repo_root: str, proc: Optional['subprocess.Popen']
+) -> Optional[Tuple[Dict[str, str], Dict[str, List[str]]]]:
+    """
+    Wait for a log started by _start_git_log() and parse it.
+
+    Returns:
+        The authors and contributors of each listed file, or None if git
+        could not be started or timed out
+    """
+    import subprocess
+
+    if proc is None:
+        return None
+
+    try:
+        stdout, _ = proc.communicate(timeout=60)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        print(f"Warning: Reading the Git history of {repo_root} timed out; looking up files one by one")
+        return None
 
-        if result.returncode == 0:
-            contributors = list(set(result.stdout.strip().split('\n')))
-            return [c for c in contributors if c.strip()]
+    # A repository without commits has no history to list
+    authors = {}
+    contributors = {}
+    if proc.returncode != 0:
+        return authors, contributors
 
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
-        pass
+    # Commits are listed newest first, so the first author seen for a path wins
+    author = None
+    for line in stdout.split('\n'):
+        if line.startswith('\x01'):
+            author = line[1:]
+        elif line and author:
+            path = os.path.join(repo_root, os.path.normpath(line))
+            authors.setdefault(path, author)
+            # Dicts keep insertion order, giving unique contributors newest first
+            contributors.setdefault(path, {})[author] = None
 
-    return []
+    return authors, {path: list(names) for path, names in contributors.items()}
+
+
+def get_git_contributors(filepath: str, limit: Optional[int] = None) -> List[str]:
+    """
+    Get all contributors who have modified this file.
+
+    Served from the same cached repository history as get_git_author(), or
+    read from this file's log when there is none.
+
+    Args:
+        filepath: Path to the file
+        limit: Return at most this many contributors
+
+    Returns:
+        List of contributor names and emails, most recent first
+    """
+    repo_root = find_git_root(filepath)
+    if repo_root is None:
+        return []
+    history = _git_history_cache.get(repo_root)
+    if history is None:
+        return _git_file_authors(repo_root, filepath)[:limit]
+    contributors = history[1].get(os.path.abspath(filepath), ())
+    return list(contributors[:limit])
 
 
 def is_git_repository(path: str) -> bool:
     """Check if the given path is inside a Git repository."""
-    try:
-        result = subprocess.run([
-            'git', 'rev-parse', '--git-dir'
-        ], cwd=os.path.dirname(os.path.abspath(path)),
-           capture_output=True, timeout=5)
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
-        return False
+    # Looking for .git needs no git process
+    return _git_root_for(os.path.dirname(os.path.abspath(path))) is not None
 
 
 def get_system_author() -> str:
@@ -280,6 +810,7 @@ def get_system_author() -> str:
 
     # Fallback to system username
     try:
+        import getpass
         username = getpass.getuser()
         return username
     except Exception:
@@ -293,63 +824,84 @@ def get_file_system_author(filepath: str) -> Optional[str]:
     Returns:
         str: File owner username or None if not available
     """
+    try:
+        return _user_name(os.stat(filepath).st_uid)
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _user_name(uid: int) -> Optional[str]:
+    """Look up a user name once per uid; files mostly share a few owners."""
     try:
         import pwd
-        stat_info = os.stat(filepath)
-        owner = pwd.getpwuid(stat_info.st_uid).pw_name
-        return owner
-    except (ImportError, KeyError, OSError):
+        return pwd.getpwuid(uid).pw_name
+    except (ImportError, KeyError):
         return None
 
 
-def determine_author(filepath: str, prefer_git: bool = True) -> str:
+def determine_author(
+    filepath: str,
+    prefer_git: bool = True,
+    git_authors: Optional[Dict[str, str]] = None
+) -> str:
     """
     Determine the author using multiple methods in order of preference.
 
     Args:
         filepath: Path to the file
         prefer_git: Whether to prefer Git information over system info
+        git_authors: Authors prefetched with prefetch_git_authors()
 
     Returns:
         str: Author information
     """
-    authors = []
+    # Prefetched Git authors spare the per-file git calls
+    if prefer_git and git_authors is not None:
+        git_author = git_authors.get(os.path.abspath(filepath))
+        if git_author:
+            return git_author
+
+    # Each method is tried only if the ones before it found nothing
 
     # Method 1: Git information (if in a git repo and prefer_git is True)
     if prefer_git and is_git_repository(filepath):
-        git_author = get_git_author(filepath)
+        if git_authors is not None:
+            # The prefetch covered the history, so the file is not committed
+            # yet; use the configured user instead of reading the log again
+            git_author = _git_config_author(os.path.dirname(os.path.abspath(filepath)))
+        else:
+            git_author = get_git_author(filepath)
+        # Contributors come from the same history as the last author, so
+        # a file without one has none either
         if git_author:
-            authors.append(("Git (last commit)", git_author))
-
-        # Also get all contributors for reference
-        contributors = get_git_contributors(filepath)
-        if contributors:
-            authors.append(("Git (all contributors)", ", ".join(contributors[:3])))  # Limit to first 3
+            return git_author
 
     # Method 2: System environment
     system_author = get_system_author()
     if system_author and system_author != "Unknown":
-        authors.append(("System environment", system_author))
+        return system_author
 
     # Method 3: File system owner
     fs_author = get_file_system_author(filepath)
     if fs_author:
-        authors.append(("File system owner", fs_author))
-
-    # Return the first available author, or fallback
-    if authors:
-        return authors[0][1]  # Return the author string from the first method
+        return fs_author
 
     return "Unknown"
 
 
-def get_author_info(filepath: str, verbose: bool = False) -> Dict[str, str]:
+def get_author_info(
+    filepath: str,
+    verbose: bool = False,
+    git_authors: Optional[Dict[str, str]] = None
+) -> Dict[str, str]:
     """
     Get comprehensive author information for a file.
 
     Args:
         filepath: Path to the file
         verbose: Whether to return detailed information
+        git_authors: Authors prefetched with prefetch_git_authors()
 
     Returns:
         Dict with author information
@@ -357,7 +909,7 @@ def get_author_info(filepath: str, verbose: bool = False) -> Dict[str, str]:
     info = {}
 
     # Primary author (best available method)
-    info['author'] = determine_author(filepath)
+    info['author'] = determine_author(filepath, git_authors=git_authors)
 
     if verbose:
         # Git information
@@ -374,34 +926,143 @@ def get_author_info(filepath: str, verbose: bool = False) -> Dict[str, str]:
 
 def read_file(filepath: str) -> str:
     """Read the content of a file with proper encoding handling."""
+    with open(filepath, 'rb') as f:
+        return _decode_text(f.read())
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode file bytes as reading in text mode would, trying UTF-8 first."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return f.read()
+        text = data.decode('utf-8')
     except UnicodeDecodeError:
-        # Fallback to system default encoding if UTF-8 fails
-        with open(filepath, 'r') as f:
-            return f.read()
+        # Fallback to system default encoding if UTF-8 fails, without reading again
+        text = data.decode(locale.getpreferredencoding(False))
+    # The newline translation of reading in text mode
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _advise_willneed(filepaths: List[str]) -> None:
+    """Ask the kernel to start reading the given files into the page cache."""
+    for filepath in filepaths:
+        try:
+            fd = os.open(filepath, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def scan_for_metadata(filepath: str) -> bool:
+    """
+    Check whether a file contains a metadata block marker without decoding it.
+
+    Large files are scanned through a memory map, so only the pages the
+    search touches are loaded; their end, where this tool writes the block,
+    is checked first.
+
+    Returns:
+        bool: True if a metadata block marker was found
+    """
+    with open(filepath, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if _METADATA_MARKER_BYTES.search(mm, size - METADATA_TAIL_SIZE) is not None:
+                    return True
+                return _METADATA_MARKER_BYTES.search(mm) is not None
+        return _METADATA_MARKER_BYTES.search(f.read()) is not None
+
+
+def _read_if_marked(filepath: str) -> Optional[str]:
+    """
+    Read a file only if it contains a metadata block marker.
+
+    Small files are read once: the bytes searched for the marker are
+    decoded as read_file() would, instead of being read a second time.
+
+    Returns:
+        The file content, or None if there is no metadata block marker
+    """
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            data = None
+        else:
+            data = f.read()
+
+    if data is None:
+        return read_file(filepath) if scan_for_metadata(filepath) else None
+    if _METADATA_MARKER_BYTES.search(data) is None:
+        return None
+    return _decode_text(data)
 
 
 def write_file(filepath: str, content: str) -> None:
-    """Write content to a file with UTF-8 encoding."""
-    with open(filepath, 'w', encoding='utf-8') as f:
+    """
+    Write content to a file with UTF-8 encoding.
+
+    Existing files are replaced atomically: the content goes to a temporary
+    file in the same directory, which is then renamed over the original, so
+    an interrupted run never leaves a half-written document behind. The new
+    file keeps the permission bits, but not the owner or extended attributes
+    of the original. Files with several hard links are written in place
+    instead, so that every link keeps seeing the same content, and so are
+    files in a directory where no temporary file can be created.
+    """
+    target = filepath
+    try:
+        # One lstat covers the common case; only symlinks need resolving
+        st = os.lstat(target)
+        if stat.S_ISLNK(st.st_mode):
+            target = os.path.realpath(filepath)
+            st = os.stat(target)
+    except FileNotFoundError:
+        st = None
+
+    # A rename would detach this path from the file's other hard links
+    if st is not None and st.st_nlink == 1:
+        import tempfile
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(target), prefix='.', suffix='.tmp'
+            )
+        except PermissionError:
+            # A read-only directory can still hold a writable file
+            pass
+        else:
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                os.chmod(tmp_path, stat.S_IMODE(st.st_mode))
+                os.replace(tmp_path, target)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            return
+
+    with open(target, 'w', encoding='utf-8') as f:
         f.write(content)
 
 
 def parse_metadata(metadata_str: str) -> Dict:
     """Parse metadata string into a dictionary."""
-    metadata = DEFAULT_METADATA.copy()
-    if not metadata_str.strip():
-        return metadata
+    if not metadata_str or metadata_str.isspace():
+        return DEFAULT_METADATA.copy()
 
     try:
-        # Try to parse as JSON first
-        parsed = json.loads(metadata_str)
+        # Try to parse as JSON first; defaults and values merge in one step
+        parsed = _loads(metadata_str)
         if isinstance(parsed, dict):
-            metadata.update(parsed)
+            return {**DEFAULT_METADATA, **parsed}
+        return DEFAULT_METADATA.copy()
     except json.JSONDecodeError:
         # Fallback to simple key-value parsing
+        metadata = DEFAULT_METADATA.copy()
         for line in metadata_str.split('\n'):
             if ':' in line:
                 key, value = line.split(':', 1)
@@ -410,12 +1071,53 @@ def parse_metadata(metadata_str: str) -> Dict:
     return metadata
 
 
+def find_metadata_block(content: str) -> Optional[re.Match]:
+    """
+    Locate the metadata block in content.
+
+    A block that ends the document, as written by this tool, is found by
+    searching backwards from the end, so its cost does not grow with the
+    document. Otherwise the full pattern is tried from the first block
+    marker onwards.
+
+    Returns:
+        The METADATA_PATTERN match, or None if there is no metadata block
+    """
+    tail_start = max(0, len(content) - METADATA_TAIL_SIZE)
+    start = content.rfind('<!--', tail_start)
+    if start < 0 and tail_start == 0:
+        # The whole document was searched and holds no comment at all
+        return None
+    while start >= 0:
+        if _METADATA_MARKER.match(content, start):
+            match = METADATA_PATTERN.match(content, start)
+            if match and match.end() == len(content):
+                return match
+            break
+        start = content.rfind('<!--', tail_start, start)
+
+    # str.find skips to candidate comments faster than a regex search
+    start = content.find('<!--')
+    while start >= 0:
+        if _METADATA_MARKER.match(content, start):
+            return METADATA_PATTERN.search(content, start)
+        start = content.find('<!--', start + 4)
+    return None
+
+
+def _cut_block(content: str, match: re.Match) -> str:
+    """Return content without the matched block; a block at the end needs one slice."""
+    if match.end() == len(content):
+        return content[:match.start()]
+    return content[:match.start()] + content[match.end():]
+
+
 def extract_metadata(content: str) -> Tuple[str, Optional[Dict]]:
     """Extract metadata block from content if it exists."""
     if not content:
         return content, None
 
-    match = METADATA_PATTERN.search(content)
+    match = find_metadata_block(content)
     if not match:
         return content, None
 
@@ -424,23 +1126,42 @@ def extract_metadata(content: str) -> Tuple[str, Optional[Dict]]:
         metadata = parse_metadata(metadata_str)
 
         # Remove the metadata block from content
-        content_without_metadata = content[:match.start()] + content[match.end():]
+        content_without_metadata = _cut_block(content, match)
         return content_without_metadata, metadata
     except Exception as e:
         print(f"Warning: Error extracting metadata: {str(e)}")
         return content, None
 
 
-def format_metadata(metadata: Dict) -> str:
-    """Format metadata dictionary into a string."""
+def current_timestamp() -> str:
+    """Current local time as stored in created_at and updated_at."""
+    # time.strftime formats the same local time without importing datetime
+    return time.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def format_metadata(metadata: Dict, now: Optional[str] = None) -> str:
+    """Format metadata dictionary into a string, stamped with now (default: the current time)."""
     # Ensure required fields are present
-    now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    if now is None:
+        now = current_timestamp()
     if not metadata.get('created_at'):
         metadata['created_at'] = now
     metadata['updated_at'] = now
 
     # Convert to pretty-printed JSON
-    return json.dumps(metadata, indent=2, ensure_ascii=False)
+    return _dumps_metadata(metadata)
+
+
+def _split_headings(text: str) -> Tuple[List[str], List[Tuple[str, str]]]:
+    """Split the headings of text into first-level texts and (level, text) subheadings."""
+    main = []
+    sub = []
+    for level, heading in HEADER_PATTERN.findall(text):
+        if level == '#':
+            main.append(heading.strip())
+        else:
+            sub.append((level, heading.strip()))
+    return main, sub
 
 
 def analyze_document_changes(old_content: str, new_content: str) -> str:
@@ -450,33 +1171,22 @@ def analyze_document_changes(old_content: str, new_content: str) -> str:
     Returns:
         str: The type of version bump needed ('major', 'medium', 'minor')
     """
-    # Извлекаем все заголовки из старого и нового содержимого
-    import re
-    def get_headings(text):
-        headings = re.findall(r'^(#{1,6})\s+(.+)$', text, re.MULTILINE)
-        # Убираем лишние пробелы и нормализуем
-        return [(l, h.strip()) for l, h in headings]
-
-    old_headings = get_headings(old_content)
-    new_headings = get_headings(new_content)
+    # Извлекаем заголовки за один проход по каждому документу
+    old_main, old_sub = _split_headings(old_content)
+    new_main, new_sub = _split_headings(new_content)
 
     # Для отладки: печать заголовков если verbose
-    import os
     if os.environ.get('METADATA_PY_VERBOSE') == '1':
-        print('OLD MAIN:', [h for l, h in old_headings if l == '#'])
-        print('NEW MAIN:', [h for l, h in new_headings if l == '#'])
-        print('OLD SUB:', [(l, h) for l, h in old_headings if l != '#'])
-        print('NEW SUB:', [(l, h) for l, h in new_headings if l != '#'])
+        print('OLD MAIN:', old_main)
+        print('NEW MAIN:', new_main)
+        print('OLD SUB:', old_sub)
+        print('NEW SUB:', new_sub)
 
     # Проверяем изменения в заголовках первого уровня (major)
-    old_main = [h for l, h in old_headings if l == '#']
-    new_main = [h for l, h in new_headings if l == '#']
     if old_main != new_main:
         return 'major'
 
     # Проверяем изменения в подзаголовках (medium)
-    old_sub = [(l, h) for l, h in old_headings if l != '#']
-    new_sub = [(l, h) for l, h in new_headings if l != '#']
     if old_sub != new_sub:
         return 'medium'
 
@@ -488,35 +1198,45 @@ def increment_version(current_version: str, bump_type: str) -> str:
     if not current_version or current_version == '0.0.0':
         return '0.0.1'
 
-    try:
-        from packaging import version as version_parser
-        v = version_parser.parse(str(current_version))
-        major, minor, patch = v.major, v.minor, v.micro
-
-        if bump_type == 'major':
-            return f"{major + 1}.0.0"
-        elif bump_type == 'medium':
-            return f"{major}.{minor + 1}.0"
-        else:  # minor
-            return f"{major}.{minor}.{patch + 1}"
-    except ImportError:
-        # Fallback if packaging is not available
-        parts = current_version.split('.')
-        while len(parts) < 3:
-            parts.append('0')
-
-        if bump_type == 'major':
-            return f"{int(parts[0]) + 1}.0.0"
-        elif bump_type == 'medium':
-            return f"{parts[0]}.{int(parts[1]) + 1}.0"
-        else:  # minor
-            return f"{parts[0]}.{parts[1]}.{int(parts[2]) + 1}"
+    parts = str(current_version).split('.')
+    if all(part.isdecimal() for part in parts):
+        # Plain MAJOR[.MINOR[.PATCH]] versions need no full version parser
+        parts += ['0'] * (3 - len(parts))
+        major, minor, patch = int(parts[0]), int(parts[1]), int(parts[2])
+    else:
+        try:
+            from packaging import version as version_parser
+        except ImportError:
+            version_parser = None
+
+        if version_parser is not None:
+            v = version_parser.parse(str(current_version))
+            major, minor, patch = v.major, v.minor, v.micro
+        else:
+            # Fallback if packaging is not available
+            while len(parts) < 3:
+                parts.append('0')
+
+            if bump_type == 'major':
+                return f"{int(parts[0]) + 1}.0.0"
+            elif bump_type == 'medium':
+                return f"{parts[0]}.{int(parts[1]) + 1}.0"
+            else:  # minor
+                return f"{parts[0]}.{parts[1]}.{int(parts[2]) + 1}"
+
+    if bump_type == 'major':
+        return f"{major + 1}.0.0"
+    elif bump_type == 'medium':
+        return f"{major}.{minor + 1}.0"
+    else:  # minor
+        return f"{major}.{minor}.{patch + 1}"
 
 def add_or_update_metadata(
     content: str,
     new_metadata: Optional[Dict] = None,
     overwrite: bool = False,
-    old_content: Optional[str] = None
+    old_content: Optional[str] = None,
+    now: Optional[str] = None
 ) -> str:
     """
     Add or update metadata in the content.
@@ -525,6 +1245,8 @@ def add_or_update_metadata(
         content: The original content of the file
         new_metadata: New metadata fields to add/update
         overwrite: If True, completely replace existing metadata
+        old_content: Previous content, used to bump the version
+        now: Timestamp for the metadata (default: the current time)
 
     Returns:
         Updated content with metadata
@@ -548,21 +1270,19 @@ def add_or_update_metadata(
         change_type = analyze_document_changes(old_content, content_without_metadata)
         current_version = metadata.get('version', '0.0.0')
         new_version = increment_version(current_version, change_type)
-        import os
         if os.environ.get('METADATA_PY_VERBOSE') == '1':
             # Для отладки: покажем тип изменения, старую и новую версию
             print(f"[VERBOSE] Version bump type: {change_type}")
             print(f"[VERBOSE] Old version: {current_version}, New version: {new_version}")
             # Покажем подзаголовки
-            import re
             def get_subheaders(text):
-                return [(l, h.strip()) for l, h in re.findall(r'^(#{2,6})\s+(.+)$', text, re.MULTILINE)]
+                return [(l, h.strip()) for l, h in HEADER_PATTERN.findall(text) if l != '#']
             print(f"[VERBOSE] Old subheaders: {get_subheaders(old_content)}")
             print(f"[VERBOSE] New subheaders: {get_subheaders(content_without_metadata)}")
         metadata['version'] = new_version
 
     # Format the metadata block
-    formatted_metadata = format_metadata(metadata)
+    formatted_metadata = format_metadata(metadata, now)
     metadata_block = f"""
 <!-- METADATA
 {formatted_metadata}
@@ -572,9 +1292,8 @@ def add_or_update_metadata(
     # Add the metadata block to the content
     content_with_metadata = content_without_metadata.rstrip()
     if content_with_metadata and not content_with_metadata.endswith('\n'):
-        content_with_metadata += '\n'
-    content_with_metadata += '\n\n' + metadata_block + '\n'
-    return content_with_metadata
+        return f"{content_with_metadata}\n\n\n{metadata_block}\n"
+    return f"{content_with_metadata}\n\n{metadata_block}\n"
 
 
 def remove_metadata(content: str) -> str:
@@ -594,38 +1313,58 @@ def get_content_without_metadata(content: str) -> str:
         content_str = str(content)
 
     # Remove the metadata block if it exists
-    match = METADATA_PATTERN.search(content_str)
+    match = find_metadata_block(content_str)
     if match:
-        content_str = content_str[:match.start()] + content_str[match.end():]
+        content_str = _cut_block(content_str, match)
 
     # Clean up any extra whitespace
     return content_str.strip()
 
 def calculate_hash(content: str) -> str:
     """Calculate SHA-256 hash of the content."""
-    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    if len(content) <= HASH_CHUNK_SIZE:
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    # Large documents are encoded piece by piece, so no full UTF-8 copy is made;
+    # the digest is the same as for the whole encoded string
+    digest = hashlib.sha256()
+    for start in range(0, len(content), HASH_CHUNK_SIZE):
+        digest.update(content[start:start + HASH_CHUNK_SIZE].encode('utf-8'))
+    return digest.hexdigest()
 
 def extract_headers(content: str) -> Set[str]:
     """Extract all headers from markdown content and return their hashes."""
-    headers = set()
-    # Match markdown headers (lines starting with 1-6 # followed by text)
-    header_pattern = r'^(#{1,6})\s+(.+)$'
-    for line in content.split('\n'):
-        match = re.match(header_pattern, line.strip())
-        if match:
-            level = len(match.group(1))
-            header_text = match.group(2).strip()
-            # Store both the level and text to detect changes in header structure
-            headers.add(f"{level}:{header_text}")
-    return headers
-
-def get_document_fingerprint(content: str) -> Dict:
-    """Create a fingerprint of the document with content and header hashes."""
+    # Match markdown headers (lines starting with 1-6 # followed by text) in
+    # one pass; store both the level and text to detect changes in header structure
+    return {
+        f"{len(level)}:{header_text}"
+        for level, header_text in _HEADER_LINE_PATTERN.findall(content)
+    }
+
+def get_document_fingerprint(content: str, headers: Optional[Iterable[str]] = None) -> Dict:
+    """
+    Create a fingerprint of the document with content and header hashes.
+
+    Callers that already have extract_headers(content) can pass it (or a
+    sorted list of it, which sorts in linear time) as headers to skip a
+    second scan.
+    """
+    if headers is None:
+        headers = extract_headers(content)
     return {
         'content_hash': calculate_hash(content),
-        'headers_hash': calculate_hash('|'.join(sorted(extract_headers(content))))
+        'headers_hash': calculate_hash('|'.join(sorted(headers)))
     }
 
+def _parse_fingerprint(value) -> Dict:
+    """Read a stored fingerprint, either a nested object or an older JSON string."""
+    if isinstance(value, str):
+        try:
+            value = _loads(value)
+        except ValueError:
+            return {}
+    return value if isinstance(value, dict) else {}
+
 def process_file(
     filepath: str,
     new_metadata: Optional[Dict] = None,
@@ -633,8 +1372,10 @@ def process_file(
     overwrite: bool = False,
     dry_run: bool = False,
     auto_author: bool = True,
-    verbose: bool = False
-) -> bool:
+    verbose: bool = False,
+    git_authors: Optional[Dict[str, str]] = None,
+    now: Optional[str] = None
+) -> Optional[bool]:
     """
     Process a single file to add, update, or remove metadata.
 
@@ -646,16 +1387,30 @@ def process_file(
         dry_run: Whether to perform a dry run
         auto_author: Whether to automatically determine author
         verbose: Whether to show verbose output
+        git_authors: Authors prefetched with prefetch_git_authors()
+        now: Timestamp for the metadata, shared by a whole run (default: the current time)
 
     Returns:
-        bool: True if the file was modified, False otherwise
+        True if the file was modified, False if it was left unchanged, and
+        None if it could not be processed (the error has been printed)
     """
     try:
-        # Read the file content
-        content = read_file(filepath)
+        # Files without a metadata block need a full read only if something will be added
+        if remove or (not new_metadata and not auto_author):
+            content = _read_if_marked(filepath)
+            if content is None:
+                if verbose:
+                    if remove:
+                        print(f"No metadata found in {filepath}")
+                    else:
+                        print(f"No changes to {filepath}")
+                return False
+        else:
+            # Read the file content
+            content = read_file(filepath)
         if not isinstance(content, str):
             print(f"Error: Expected string content, got {type(content)}")
-            return False
+            return None
 
         original_content = content
         content_without_metadata, current_metadata = extract_metadata(content)
@@ -671,20 +1426,19 @@ def process_file(
                 print(f"[DRY-RUN] Would remove metadata block from {filepath}")
                 if current_metadata:
                     print("--- Old metadata block ---")
-                    print(json.dumps(current_metadata, indent=2, ensure_ascii=False))
+                    print(_dumps_metadata(current_metadata))
                     print("--------------------------")
                 return True
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            write_file(filepath, new_content)
             print(f"{action} {filepath}")
             return True
 
         # --- основной блок добавления/обновления метаданных ---
-        if new_metadata is None:
-            new_metadata = {}
+        # Work on a copy so a detected author does not leak into the next file
+        new_metadata = dict(new_metadata or {})
 
         if auto_author and 'author' not in new_metadata:
-            author_info = get_author_info(filepath, verbose)
+            author_info = get_author_info(filepath, verbose, git_authors)
             new_metadata['author'] = author_info['author']
             if verbose:
                 print(f"Auto-detected author for {filepath}: {author_info['author']}")
@@ -696,15 +1450,16 @@ def process_file(
         else:
             metadata = {**DEFAULT_METADATA, **new_metadata}
 
-        current_fingerprint = get_document_fingerprint(content_without_metadata)
+        # The headers feed both the fingerprint and the version bump below
+        new_headers = extract_headers(content_without_metadata)
+        sorted_headers = sorted(new_headers)
+        current_fingerprint = get_document_fingerprint(content_without_metadata, sorted_headers)
         previous_fingerprint = {}
         if current_metadata and '_fingerprint' in current_metadata:
-            try:
-                previous_fingerprint = json.loads(current_metadata['_fingerprint'])
-            except (json.JSONDecodeError, TypeError):
-                previous_fingerprint = {}
+            previous_fingerprint = _parse_fingerprint(current_metadata['_fingerprint'])
 
-        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        if now is None:
+            now = current_timestamp()
         if 'created_at' not in metadata or not metadata['created_at']:
             metadata['created_at'] = now
 
@@ -718,11 +1473,10 @@ def process_file(
             current_version = metadata.get('version', '0.0.0')
             old_headers_data = previous_fingerprint.get('headers', '[]')
             try:
-                old_headers_list = json.loads(old_headers_data) if isinstance(old_headers_data, str) else old_headers_data
+                old_headers_list = _loads(old_headers_data) if isinstance(old_headers_data, str) else old_headers_data
                 old_headers = set(old_headers_list) if isinstance(old_headers_list, list) else set()
             except (json.JSONDecodeError, TypeError):
                 old_headers = set()
-            new_headers = extract_headers(content_without_metadata)
             old_main_headers = {h for h in old_headers if h.startswith('1:')}
             new_main_headers = {h for h in new_headers if h.startswith('1:')}
             if old_main_headers != new_main_headers:
@@ -737,15 +1491,12 @@ def process_file(
                 metadata['version'] = increment_version(current_version, 'minor')
                 if verbose:
                     print(f"Minor changes detected, updating version to {metadata['version']}")
-            current_fingerprint['headers'] = json.dumps(list(new_headers))
+            current_fingerprint['headers'] = sorted_headers
 
-        metadata['_fingerprint'] = json.dumps(current_fingerprint)
-        metadata['updated_at'] = now
-        formatted_metadata = format_metadata(metadata)
-        metadata_block = f"<!-- METADATA\n{formatted_metadata}\n-->"
-        new_content = content_without_metadata.rstrip() + '\n\n' + metadata_block + '\n'
+        # Stored as a nested object; older files hold it as a JSON string
+        metadata['_fingerprint'] = current_fingerprint
 
-        # Check if metadata actually changed
+        # Check if metadata actually changed before formatting the new block
         if current_metadata:
             # Compare metadata excluding updated_at field for change detection
             old_meta_for_comparison = {k: v for k, v in current_metadata.items() if k != 'updated_at'}
@@ -759,6 +1510,11 @@ def process_file(
             if verbose:
                 print(f"No changes to {filepath}")
             return False
+
+        metadata['updated_at'] = now
+        formatted_metadata = format_metadata(metadata, now)
+        metadata_block = f"<!-- METADATA\n{formatted_metadata}\n-->"
+        new_content = f"{content_without_metadata.rstrip()}\n\n{metadata_block}\n"
         action = "Updated metadata in"
         if dry_run:
             if not current_metadata:
@@ -769,21 +1525,30 @@ def process_file(
             else:
                 print(f"[DRY-RUN] Would update metadata block in {filepath}")
                 print("--- Old metadata block ---")
-                print(json.dumps(current_metadata, indent=2, ensure_ascii=False))
+                print(_dumps_metadata(current_metadata))
                 print("--- New metadata block ---")
                 print(metadata_block)
                 print("--------------------------")
             return True
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+
+        # Leave the file (and its mtime) alone if the bytes would not change
+        if new_content == original_content:
+            if verbose:
+                print(f"No changes to {filepath}")
+            return False
+
+        write_file(filepath, new_content)
         print(f"{action} {filepath}")
         return True
+    except FileNotFoundError:
+        print(f"Warning: File not found: {filepath}")
+        return None
     except Exception as e:
         print(f"Error processing {filepath}: {str(e)}")
         if verbose:
             import traceback
             traceback.print_exc()
-        return False
+        return None
 
 
 def process_bulk(
@@ -796,40 +1561,214 @@ def process_bulk(
     verbose: bool = False,
     ignore_patterns: Optional[List[str]] = None,
     include_root: bool = True,
-    ignore_file: Optional[str] = None
+    ignore_file: Optional[str] = None,
+    markdown_files: Optional[List[str]] = None,
+    jobs: int = 1,
+    cache_file: Optional[str] = None
     ) -> Tuple[int, int]:
-    # Load ignore patterns
-    if ignore_patterns is None:
-        ignore_patterns = load_ignore_patterns(ignore_file)
-
-    # Find all markdown files
-    markdown_files = find_markdown_files(
-        root_dir, ignore_patterns, include_root, verbose
-    )
+    # With jobs > 1 files are processed in worker processes; verbose output keeps runs serial.
+    # With a cache_file, files whose mtime and size are unchanged since a run with the
+    # same options are skipped.
+    # Callers that already walked the tree pass markdown_files to skip a second walk
+    if markdown_files is None:
+        # Load ignore patterns
+        if ignore_patterns is None:
+            ignore_patterns = load_ignore_patterns(ignore_file)
+
+        # Find all markdown files
+        markdown_files = find_markdown_files(
+            root_dir, ignore_patterns, include_root, verbose, by_inode=INODE_ORDER
+        )
 
     if verbose:
         print(f"Found {len(markdown_files)} markdown files to process")
         if not include_root:
             print("Excluding root directory files")
 
-    # Process each file
+    pending = markdown_files
+    if cache_file is not None:
+        options_key = _bulk_options_key(new_metadata, remove, overwrite, auto_author)
+        cached = _load_bulk_cache(cache_file, options_key)
+        pending = [
+            filepath for filepath in markdown_files
+            if cached.get(os.path.relpath(filepath, root_dir)) != _file_signature(filepath)
+        ]
+        if verbose and len(pending) < len(markdown_files):
+            print(f"Skipping {len(markdown_files) - len(pending)} files unchanged since the last run")
+
+    # Read each repository's history once instead of running git per file
+    git_authors = None
+    if auto_author and not remove and 'author' not in (new_metadata or {}):
+        git_authors = prefetch_git_authors(pending)
+
+    # Bind the options once; only the path changes between files, and every
+    # file of the run gets the same timestamp
+    process = partial(
+        process_file,
+        new_metadata=new_metadata,
+        remove=remove,
+        overwrite=overwrite,
+        dry_run=dry_run,
+        auto_author=auto_author,
+        verbose=verbose,
+        git_authors=git_authors,
+        now=current_timestamp()
+    )
+
+    if verbose:
+        jobs = 1
+
+    # Let the kernel read the files ahead while earlier ones are processed;
+    # worker processes already overlap their reads
+    if not _use_pool(pending, jobs) and len(pending) > 1 and hasattr(os, 'posix_fadvise'):
+        import threading
+        threading.Thread(
+            target=_advise_willneed, args=(pending,), daemon=True
+        ).start()
+
+    # Process each file; files that failed are remembered so the cache
+    # does not skip them next time
     modified_count = 0
-    for filepath in markdown_files:
-        if process_file(
-            filepath,
-            new_metadata,
-            remove,
-            overwrite,
-            dry_run,
-            auto_author,
-            verbose
-        ):
+    failed = set()
+    for filepath, modified in zip(pending, map_files(process, pending, jobs)):
+        if modified is None:
+            failed.add(filepath)
+        elif modified:
             modified_count += 1
 
+    # Dry runs change nothing, so the cache only records real runs
+    if cache_file is not None and not dry_run:
+        files = {}
+        for filepath in markdown_files:
+            if filepath in failed:
+                continue
+            signature = _file_signature(filepath)
+            if signature is not None:
+                files[os.path.relpath(filepath, root_dir)] = signature
+        _save_bulk_cache(cache_file, options_key, files)
+
     return len(markdown_files), modified_count
 
 
+def _bulk_options_key(
+    new_metadata: Optional[Dict], remove: bool, overwrite: bool, auto_author: bool
+) -> str:
+    """Hash the options that decide what process_file() does to an unchanged file."""
+    options = [new_metadata or {}, remove, overwrite, auto_author]
+    return calculate_hash(json.dumps(options, sort_keys=True, default=str))
+
+
+def _file_signature(filepath: str) -> Optional[List[int]]:
+    """Return [mtime_ns, size] of a file, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _load_bulk_cache(cache_file: str, options_key: str) -> Dict[str, List]:
+    """Load the file signatures recorded by a previous run with the same options."""
+    try:
+        with open(cache_file, 'rb') as f:
+            cache = _loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('options') != options_key:
+        return {}
+    files = cache.get('files')
+    return files if isinstance(files, dict) else {}
+
+
+def _save_bulk_cache(cache_file: str, options_key: str, files: Dict[str, List]) -> None:
+    """Write the file signatures of this run; failures only cost the next run time."""
+    try:
+        write_file(cache_file, _dumps_compact({'options': options_key, 'files': files}))
+    except OSError as e:
+        print(f"Warning: Could not write cache file {cache_file}: {e}")
+
+
+def _use_pool(filepaths: List[str], jobs: int) -> bool:
+    """Check whether map_files() would start worker processes."""
+    return jobs > 1 and len(filepaths) >= PARALLEL_THRESHOLD
+
+
+def map_files(
+    process: Callable[[str], Optional[bool]], filepaths: List[str], jobs: int = 1
+) -> Iterator[Optional[bool]]:
+    """
+    Apply process to every file, in worker processes when jobs > 1.
+
+    The function is sent to each worker once, when the worker starts, so
+    large bound arguments such as prefetched Git authors are not pickled
+    again for every chunk. Results are yielded in file order. What a worker
+    prints is written by this process, after the file is done, and stdout is
+    flushed after each file.
+
+    Args:
+        process: Picklable function taking a file path
+        filepaths: Paths of the files to process
+        jobs: Number of worker processes (1 processes files in this process)
+
+    Returns:
+        Iterator over the results of process
+    """
+    if not _use_pool(filepaths, jobs):
+        for filepath in filepaths:
+            result = process(filepath)
+            # Show each file's output as soon as it is done, even when the
+            # caller block-buffers stdout
+            sys.stdout.flush()
+            yield result
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Forked workers inherit unflushed output and would print it again
+    sys.stdout.flush()
+
+    # No more workers than files; Windows allows at most 61
+    workers = min(jobs, len(filepaths))
+    if sys.platform == 'win32':
+        workers = min(workers, 61)
+
+    # Several chunks per worker amortize IPC without starving workers
+    chunksize = max(1, len(filepaths) // (4 * workers))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(process,)
+    ) as executor:
+        # Workers hand their output back, so it is printed here in file
+        # order and lines of different workers never interleave
+        for result, output in executor.map(_run_worker, filepaths, chunksize=chunksize):
+            if output:
+                sys.stdout.write(output)
+            sys.stdout.flush()
+            yield result
+
+
+# Function installed in each worker process by _init_worker()
+_worker_process: Optional[Callable[[str], Optional[bool]]] = None
+
+
+def _init_worker(process: Callable[[str], Optional[bool]]) -> None:
+    global _worker_process
+    _worker_process = process
+
+
+def _run_worker(filepath: str) -> Tuple[Optional[bool], str]:
+    """Process one file in a worker process, returning its result and what it printed."""
+    import io
+    from contextlib import redirect_stdout
+
+    output = io.StringIO()
+    with redirect_stdout(output):
+        result = _worker_process(filepath)
+    return result, output.getvalue()
+
+
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Manage metadata blocks in markdown files with automatic author detection and bulk processing.'
     )
@@ -886,6 +1825,14 @@ def main():
         action='store_true',
         help='Show verbose output including author detection details'
     )
+    parser.add_argument(
+        '--jobs',
+        '-j',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Number of worker processes (default: number of CPUs, 1 disables parallelism)'
+    )
 
     # Bulk processing options
     parser.add_argument(
@@ -917,6 +1864,11 @@ def main():
         action='store_true',
         help='List all markdown files that would be processed'
     )
+    parser.add_argument(
+        '--sort',
+        action='store_true',
+        help='With --list-files, list files sorted by path instead of in walk order'
+    )
 
     args = parser.parse_args()
 
@@ -928,48 +1880,67 @@ def main():
         root_dir = args.bulk if args.bulk else "."
 
         # Handle ignore patterns
-        ignore_patterns = None
+        # Resolved once for every mode below (--ignore replaces the ignore file)
         if args.ignore:
             ignore_patterns = DEFAULT_IGNORE_PATTERNS.copy()
             ignore_patterns.extend(args.ignore)
+        else:
+            ignore_patterns = load_ignore_patterns(args.ignore_file)
 
-        # List files mode
-        if args.list_files or args.show_info:
-            markdown_files = find_markdown_files(
-                root_dir,
-                ignore_patterns or load_ignore_patterns(args.ignore_file),
-                not args.exclude_root,
-                args.verbose
-            )
+        # List files mode: paths are printed as the walk finds them unless --sort is given
         if args.list_files:
-            print(f"Found {len(markdown_files)} markdown files:")
-            for filepath in sorted(markdown_files):
-                print(f"  {filepath}")
+            if args.sort:
+                filepaths = find_markdown_files(root_dir, ignore_patterns, not args.exclude_root, args.verbose)
+            else:
+                filepaths = iter_markdown_files(root_dir, ignore_patterns, not args.exclude_root, args.verbose)
+            # Paths are written in batches: a line-buffered terminal then flushes
+            # once per batch instead of once per path
+            write = sys.stdout.write
+            write("Markdown files:\n")
+            count = 0
+            batch = []
+            for filepath in filepaths:
+                batch.append(f"  {filepath}\n")
+                if len(batch) == 256:
+                    write(''.join(batch))
+                    count += len(batch)
+                    batch.clear()
+            write(''.join(batch))
+            count += len(batch)
+            write(f"Found {count} markdown files\n")
             return
 
-        # Show info mode
+        # Show info mode (the walk prunes ignored directories and returns sorted paths)
         if args.show_info:
+            markdown_files = find_markdown_files(
+                root_dir, ignore_patterns, not args.exclude_root, args.verbose
+            )
             print(f"Author information for {len(markdown_files)} markdown files:\n")
-            for filepath in sorted(markdown_files):
+            # One git log per repository covers the primary author of every file
+            git_authors = prefetch_git_authors(markdown_files)
+            write = sys.stdout.write
+            for filepath in markdown_files:
                 try:
-                    author_info = get_author_info(filepath, verbose=True)
-                    print(f"File: {filepath}")
-                    print(f"  Primary author: {author_info['author']}")
+                    # The details are looked up only when they will be shown
+                    author_info = get_author_info(filepath, verbose=args.verbose, git_authors=git_authors)
+                    lines = [f"File: {filepath}\n", f"  Primary author: {author_info['author']}\n"]
 
                     if args.verbose:
                         if 'git_last_author' in author_info and author_info['git_last_author']:
-                            print(f"  Git last author: {author_info['git_last_author']}")
+                            lines.append(f"  Git last author: {author_info['git_last_author']}\n")
                         if 'git_contributors' in author_info:
                             contributors = author_info['git_contributors'][:3] if author_info['git_contributors'] else []
                             if contributors:
-                                print(f"  Git contributors: {', '.join(contributors)}")
+                                lines.append(f"  Git contributors: {', '.join(contributors)}\n")
                         if 'system_author' in author_info:
-                            print(f"  System author: {author_info['system_author']}")
+                            lines.append(f"  System author: {author_info['system_author']}\n")
                         if 'file_owner' in author_info and author_info['file_owner']:
-                            print(f"  File owner: {author_info['file_owner']}")
-                    print()
+                            lines.append(f"  File owner: {author_info['file_owner']}\n")
+                    # One write per file instead of one print per line
+                    write(''.join(lines) + '\n')
                 except Exception as e:
-                    print(f"Error getting info for {filepath}: {e}")
+                    write(f"Error getting info for {filepath}: {e}\n")
+            sys.stdout.flush()
             return
 
     elif args.files:
@@ -982,11 +1953,14 @@ def main():
     new_metadata = {}
     if args.set:
         for item in args.set:
-            if '=' not in item:
+            key, sep, value = item.partition('=')
+            if not sep:
                 parser.error(f"Invalid metadata format: {item}. Use KEY=VALUE format.")
-            key, value = item.split('=', 1)
             new_metadata[key.strip()] = value.strip()
 
+    # Verbose output stays in file order only when files are processed serially
+    jobs = 1 if args.verbose else args.jobs or os.cpu_count() or 1
+
     # Process files
     if args.bulk is not None:
         # Bulk processing
@@ -1000,7 +1974,7 @@ def main():
             verbose=args.verbose,
             ignore_patterns=ignore_patterns,
             include_root=not args.exclude_root,
-            ignore_file=args.ignore_file
+            jobs=jobs
         )
 
         if args.dry_run:
@@ -1009,26 +1983,32 @@ def main():
             print(f"\nBulk processing completed: {modified_files}/{total_files} files modified")
     else:
         # Single file processing
-        modified_count = 0
+        valid_files = []
         for filepath in files_to_process:
-            if not os.path.exists(filepath):
-                print(f"Warning: File not found: {filepath}")
-                continue
-
-            if not filepath.lower().endswith(('.md', '.markdown')):
+            # Missing files are reported by process_file when it opens them
+            if not is_markdown_file(filepath):
                 print(f"Warning: Not a markdown file: {filepath}")
                 continue
+            valid_files.append(filepath)
 
-            if process_file(
-                filepath,
-                new_metadata,
-                args.remove,
-                args.overwrite,
-                args.dry_run,
-                not args.no_auto_author,
-                args.verbose
-            ):
-                modified_count += 1
+        # Read each repository's history once here; worker processes would
+        # otherwise each run their own git log
+        git_authors = None
+        if not args.no_auto_author and not args.remove and 'author' not in new_metadata:
+            git_authors = prefetch_git_authors(valid_files)
+
+        process = partial(
+            process_file,
+            new_metadata=new_metadata,
+            remove=args.remove,
+            overwrite=args.overwrite,
+            dry_run=args.dry_run,
+            auto_author=not args.no_auto_author,
+            verbose=args.verbose,
+            git_authors=git_authors,
+            now=current_timestamp()
+        )
+        modified_count = sum(1 for modified in map_files(process, valid_files, jobs) if modified)
 
         if args.dry_run:
             print(f"\nDry run completed: {modified_count}/{len(files_to_process)} files would be modified")
@@ -1071,78 +2051,193 @@ def create_ignore_file(filepath: str = ".mdignore", patterns: List[str] = None)
 
 
 # Функция для проверки статуса обработки проекта
-def get_project_status(root_dir: str = ".", ignore_file: str = None) -> Dict:
-    # Get comprehensive status of markdown files in the project.
-    ignore_patterns = load_ignore_patterns(ignore_file)
-    markdown_files = find_markdown_files(root_dir, ignore_patterns, True, False)
+def _read_trailing_metadata(filepath: str) -> Optional[Dict]:
+    """
+    Read the metadata block that ends a large file from its last bytes only.
 
-    status = {
-        'total_files': len(markdown_files),
-        'files_with_metadata': 0,
-        'files_without_metadata': 0,
-        'authors': set(),
-        'versions': {},
-        'last_updated': None,
-        'files_by_author': {},
-        'files_without_author': []
-    }
+    Returns:
+        The parsed metadata, or None if the file is small or its end holds
+        no complete, valid block; the caller then reads the whole file
+    """
+    with open(filepath, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= METADATA_TAIL_SIZE:
+            return None
+        f.seek(size - METADATA_TAIL_SIZE)
+        tail = f.read()
+
+    # Same backward search as find_metadata_block(), on bytes
+    start = tail.rfind(b'<!--')
+    while start >= 0:
+        if _METADATA_MARKER_BYTES.match(tail, start):
+            try:
+                text = tail[start:].decode('utf-8')
+                match = METADATA_PATTERN.match(text)
+                if match and match.end() == len(text):
+                    return parse_metadata(match.group(1).strip())
+            except Exception:
+                pass
+            return None
+        start = tail.rfind(b'<!--', 0, start)
+    return None
 
-    for filepath in markdown_files:
-        try:
-            content = read_file(filepath)
-            _, metadata = extract_metadata(content)
 
+def _read_file_metadata(filepath: str) -> Tuple[Optional[Dict], Optional[Exception]]:
+    # Extract the metadata of one file for the status scan, returning any error instead of raising.
+    # The status needs no document text, so large files are read from their end first.
+    try:
+        metadata = _read_trailing_metadata(filepath)
+        if metadata is None:
+            _, metadata = extract_metadata(read_file(filepath))
+        return metadata, None
+    except Exception as e:
+        return None, e
+
+
+def _read_cached_metadata(
+    root_dir: str, cached: Dict[str, List], fresh: Dict[str, List], filepath: str
+) -> Tuple[Optional[Dict], Optional[Exception]]:
+    # Like _read_file_metadata(), reusing the metadata cached for an unchanged [mtime_ns, size]
+    # and recording [mtime_ns, size, metadata] in fresh for the next run.
+    rel_path = os.path.relpath(filepath, root_dir)
+    signature = _file_signature(filepath)
+    entry = cached.get(rel_path)
+    if (signature is not None and isinstance(entry, list) and len(entry) == 3
+            and entry[:2] == signature and (entry[2] is None or isinstance(entry[2], dict))):
+        metadata, error = entry[2], None
+    else:
+        metadata, error = _read_file_metadata(filepath)
+    if signature is not None and error is None:
+        fresh[rel_path] = signature + [metadata]
+    return metadata, error
+
+
+def _aggregate_status(
+    markdown_files: List[str], results: Iterable[Tuple[Optional[Dict], Optional[Exception]]]
+) -> Dict:
+    """Build the project status from the (metadata, error) result of each file, in file order."""
+    # Aggregated in locals and stored in the status dict once, after the loop;
+    # authors are the keys of files_by_author, listed for JSON serialization
+    files_with_metadata = 0
+    files_without_metadata = 0
+    versions = Counter()
+    last_updated = None
+    files_by_author = defaultdict(list)
+    files_without_author = []
+
+    for filepath, (metadata, error) in zip(markdown_files, results):
+        if error is not None:
+            print(f"Warning: Error analyzing {filepath}: {error}")
+            continue
+
+        try:
             if metadata:
-                status['files_with_metadata'] += 1
+                files_with_metadata += 1
 
                 # Track authors
                 author = metadata.get('author', '')
                 if author:
-                    status['authors'].add(author)
-                    if author not in status['files_by_author']:
-                        status['files_by_author'][author] = []
-                    status['files_by_author'][author].append(filepath)
+                    files_by_author[author].append(filepath)
                 else:
-                    status['files_without_author'].append(filepath)
+                    files_without_author.append(filepath)
 
                 # Track versions
                 version = metadata.get('version', '')
                 if version:
-                    if version not in status['versions']:
-                        status['versions'][version] = 0
-                    status['versions'][version] += 1
+                    versions[version] += 1
 
                 # Track last updated
                 updated_at = metadata.get('updated_at', '')
-                if updated_at:
-                    if not status['last_updated'] or updated_at > status['last_updated']:
-                        status['last_updated'] = updated_at
+                if updated_at and (not last_updated or updated_at > last_updated):
+                    last_updated = updated_at
             else:
-                status['files_without_metadata'] += 1
-                status['files_without_author'].append(filepath)
+                files_without_metadata += 1
+                files_without_author.append(filepath)
 
         except Exception as e:
             print(f"Warning: Error analyzing {filepath}: {e}")
 
-    # Convert set to list for JSON serialization
-    status['authors'] = list(status['authors'])
+    return {
+        'total_files': len(markdown_files),
+        'files_with_metadata': files_with_metadata,
+        'files_without_metadata': files_without_metadata,
+        'authors': list(files_by_author),
+        'versions': dict(versions),
+        'last_updated': last_updated,
+        'files_by_author': dict(files_by_author),
+        'files_without_author': files_without_author
+    }
+
+
+def get_project_status(
+    root_dir: str = ".", ignore_file: str = None, jobs: int = 1, cache_file: Optional[str] = None
+) -> Dict:
+    # Get comprehensive status of markdown files in the project.
+    # With jobs > 1 the files are read and parsed on a thread pool; results are aggregated in file order.
+    # With a cache_file, the metadata of files whose mtime and size are unchanged is not read again.
+    ignore_patterns = load_ignore_patterns(ignore_file)
+    markdown_files = find_markdown_files(root_dir, ignore_patterns, True, False)
+
+    read_metadata = _read_file_metadata
+    if cache_file is not None:
+        fresh = {}
+        read_metadata = partial(
+            _read_cached_metadata, root_dir, _load_bulk_cache(cache_file, _STATUS_CACHE_KEY), fresh
+        )
+
+    if jobs > 1 and len(markdown_files) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # The pool is shut down even if aggregation fails part way
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            status = _aggregate_status(markdown_files, executor.map(read_metadata, markdown_files))
+    else:
+        status = _aggregate_status(markdown_files, map(read_metadata, markdown_files))
+
+    if cache_file is not None:
+        _save_bulk_cache(cache_file, _STATUS_CACHE_KEY, fresh)
 
     return status
 
 
+def dump_project_status(status: Dict) -> str:
+    """Serialize a status from get_project_status() as compact JSON."""
+    return _dumps_compact(status)
+
+
 # Функция для создания отчета о состоянии проекта
-def generate_project_report(root_dir: str = ".", output_file: str = None) -> str:
+def generate_project_report(
+    root_dir: str = ".", output_file: str = None, jobs: int = 1, status: Optional[Dict] = None
+) -> str:
     # Generate a comprehensive report about the project's markdown files.
-    status = get_project_status(root_dir)
+    # A status already computed by get_project_status() is reused instead of walking the tree again.
+    report = ''.join(iter_project_report(root_dir, jobs, status=status))
+
+    if output_file:
+        try:
+            write_file(output_file, report)
+            print(f"Report saved to: {output_file}")
+        except Exception as e:
+            print(f"Error saving report: {e}")
+
+    return report
+
+
+def iter_project_report(
+    root_dir: str = ".", jobs: int = 1, cache_file: Optional[str] = None, status: Optional[Dict] = None
+) -> Iterator[str]:
+    # Yield the project report section by section, so it can be streamed to a file.
+    if status is None:
+        status = get_project_status(root_dir, jobs=jobs, cache_file=cache_file)
 
     if status['total_files']:
         coverage = (status['files_with_metadata'] / status['total_files']) * 100
     else:
         coverage = 0.0
-    report = (
+    yield (
         f"# Markdown Files Metadata Report\n"
         f"\n"
-        f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        f"Generated on: {current_timestamp()}\n"
         f"Project directory: {os.path.abspath(root_dir)}\n"
         f"\n"
         f"## Summary\n"
@@ -1155,28 +2250,21 @@ def generate_project_report(root_dir: str = ".", output_file: str = None) -> str
         f"Total authors: {len(status['authors'])}\n"
     )
 
+    # A status passed in by the caller is left as it was, so authors are sorted into a copy
     if status['authors']:
         for author in sorted(status['authors']):
             file_count = len(status['files_by_author'].get(author, []))
-            report += f"- {author}: {file_count} files\n"
+            yield f"- {author}: {file_count} files\n"
 
-    report += f"\n## Version Distribution\n"
+    yield "\n## Version Distribution\n"
     for version, count in sorted(status['versions'].items()):
-        report += f"- v{version}: {count} files\n"
+        yield f"- v{version}: {count} files\n"
 
     if status['files_without_author']:
-        report += f"\n## Files Without Author ({len(status['files_without_author'])})\n"
-        for filepath in sorted(status['files_without_author']):
-            report += f"- {filepath}\n"
+        yield f"\n## Files Without Author ({len(status['files_without_author'])})\n"
+        # Collected in the order of find_markdown_files(), which is already sorted
+        for filepath in status['files_without_author']:
+            yield f"- {filepath}\n"
 
     if status['last_updated']:
-        report += f"\n## Last Updated\n{status['last_updated']}\n"
-
-    if output_file:
-        try:
-            write_file(output_file, report)
-            print(f"Report saved to: {output_file}")
-        except Exception as e:
-            print(f"Error saving report: {e}")
-
-    return report
\ No newline at end of file
+        yield f"\n## Last Updated\n{status['last_updated']}\n"